@@ -3,6 +3,7 @@ Admin configuration for content app.
 """
 from django.contrib import admin
 from .models import Content, Comment, Bookmark
+from .search import match_content
 
 
 @admin.register(Content)
@@ -11,8 +12,10 @@ class ContentAdmin(admin.ModelAdmin):
     Admin for Content model.
     """
     list_display = ('content_type', 'title', 'target_grade', 'target_school', 'source', 'published_at', 'is_active')
-    list_filter = ('content_type', 'source', 'is_active', 'target_grade', 'created_at', 'published_at')
-    search_fields = ('title', 'body', 'target_school')
+    list_filter = (
+        'content_type', 'source', 'is_active', 'target_grade', 'target_school', 'created_at', 'published_at',
+    )
+    search_fields = ('title', 'body')
     date_hierarchy = 'published_at'
     readonly_fields = ('hash', 'created_at')
 
@@ -34,6 +37,12 @@ class ContentAdmin(admin.ModelAdmin):
         """Optimize queryset for admin."""
         return super().get_queryset(request).select_related()
 
+    def get_search_results(self, request, queryset, search_term):
+        """Search title and body through the full-text index; schools are picked from the list filter."""
+        if not search_term:
+            return queryset, False
+        return match_content(queryset, search_term), False
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
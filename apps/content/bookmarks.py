@@ -0,0 +1,54 @@
+"""
+Atomic bookmark toggling and the cached list of a user's bookmarked items.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from apps.core.cache import get_or_set
+from apps.core.db import retry_on_database_lock
+from .conditional import VERSION_STAMP_TIMEOUT, get_version_stamp
+from .models import Content, Bookmark
+
+
+def get_bookmarked_content_ids(user):
+    """
+    Get the IDs of the content a user has bookmarked, newest bookmark first.
+    Cached under the user's bookmark version, so any bookmark change misses.
+    """
+    def build():
+        return [
+            str(content_id) for content_id in
+            Bookmark.objects.filter(user=user).order_by('-created_at').values_list('content_id', flat=True)
+        ]
+
+    key = f"bookmark-ids:{user.pk}:{get_version_stamp(f'bookmarks:{user.pk}')}"
+    return get_or_set(key, build, VERSION_STAMP_TIMEOUT)
+
+
+@retry_on_database_lock
+def toggle_bookmark_for_user(user, content_id):
+    """
+    Add the user's bookmark on a content item, or remove it if present.
+
+    Runs in one transaction that opens with a no-op UPDATE of the content
+    row. That checks the item is visible and takes the row lock (the write
+    lock on SQLite) up front, so concurrent toggles on the item queue up
+    instead of racing on the unique (user, content) constraint.
+    Returns (bookmarked, bookmark_count), or None if the content is missing.
+    """
+    with transaction.atomic():
+        locked = Content.objects.filter(pk=content_id, is_active=True).update(bookmark_count=F('bookmark_count'))
+        if not locked:
+            return None
+
+        # Counter updates run in the bookmark signals
+        deleted, _ = Bookmark.objects.filter(user=user, content_id=content_id).delete()
+        bookmarked = not deleted
+        if bookmarked:
+            try:
+                with transaction.atomic():
+                    Bookmark.objects.create(user=user, content_id=content_id)
+            except IntegrityError:
+                # Inserted concurrently; the bookmark exists either way
+                pass
+
+        return bookmarked, Content.objects.values_list('bookmark_count', flat=True).get(pk=content_id)
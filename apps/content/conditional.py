@@ -0,0 +1,101 @@
+"""
+HTTP conditional GET support built on cheap version stamps.
+
+A version stamp is a timestamp kept in the cache under a name such as
+"feed" or "comments:<content_id>". Writes bump the stamps they affect, and
+read endpoints derive their ETag/Last-Modified from the stamps, so an
+unchanged resource is answered with 304 before any query or serialization.
+Stamps expire after VERSION_STAMP_TIMEOUT and restart at the current time,
+which only costs one full response; a worker that missed a bump (cache not
+shared, Redis fallback) therefore serves 304s for a bounded time at most.
+"""
+import hashlib
+import time
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+VERSION_KEY_PREFIX = 'version'
+VERSION_STAMP_TIMEOUT = 600
+
+
+def get_version_stamp(name):
+    """Get a version stamp, initialising it to now if missing."""
+    key = f"{VERSION_KEY_PREFIX}:{name}"
+    stamp = cache.get(key)
+    if stamp is None:
+        cache.add(key, time.time(), VERSION_STAMP_TIMEOUT)
+        stamp = cache.get(key, time.time())
+    return stamp
+
+
+def get_version_stamps(names):
+    """Get several version stamps in one cache round trip, initialising missing ones to now."""
+    keys = [f"{VERSION_KEY_PREFIX}:{name}" for name in names]
+    stamps = cache.get_many(keys)
+    missing = {key: time.time() for key in keys if key not in stamps}
+    if missing:
+        # A concurrent bump overwritten here still moves the stamp off its old value
+        cache.set_many(missing, VERSION_STAMP_TIMEOUT)
+        stamps.update(missing)
+    return [stamps[key] for key in keys]
+
+
+def bump_version_stamp(name):
+    """Move a version stamp forward to now."""
+    cache.set(f"{VERSION_KEY_PREFIX}:{name}", time.time(), VERSION_STAMP_TIMEOUT)
+
+
+def make_etag(*parts):
+    """Build a quoted ETag from the given parts."""
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return quote_etag(digest)
+
+
+def get_not_modified_response(request, etag=None, last_modified=None):
+    """Get a 304 response if the request's validators match, otherwise None."""
+    if last_modified is not None:
+        last_modified = int(last_modified)
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_conditional_headers(response, request, etag=None, last_modified=None):
+    """Set ETag/Last-Modified and revalidation headers on a response."""
+    if etag:
+        response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(int(last_modified))
+    if request.user.is_authenticated:
+        patch_cache_control(response, no_cache=True, private=True)
+    else:
+        patch_cache_control(response, no_cache=True, public=True)
+    patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET requests with 304 when the client's validators still match.
+    Views override get_etag() and optionally get_last_modified().
+    """
+
+    def get_etag(self, request):
+        return None
+
+    def get_last_modified(self, request):
+        return None
+
+    def get(self, request, *args, **kwargs):
+        etag = self.get_etag(request)
+        last_modified = self.get_last_modified(request)
+        if etag is None and last_modified is None:
+            return super().get(request, *args, **kwargs)
+
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        if 200 <= response.status_code < 300:
+            set_conditional_headers(response, request, etag, last_modified)
+        return response
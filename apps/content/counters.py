@@ -0,0 +1,72 @@
+"""
+Denormalized bookmark and comment counters on Content.
+
+Counters move with single-statement F() updates as bookmarks and active
+comments come and go, so feed pages can show engagement without COUNT(*)
+queries. reconcile_counters() recomputes them from the source tables.
+"""
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from .models import Content, Comment, Bookmark
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+def adjust_counter(content_id, field, delta):
+    """Add delta to a content counter without going below zero."""
+    queryset = Content.objects.filter(pk=content_id)
+    if delta < 0:
+        queryset = queryset.filter(**{f'{field}__gte': -delta})
+    return queryset.update(**{field: F(field) + delta})
+
+
+def refresh_comment_count(content_id):
+    """Recompute one content's active comment count."""
+    count = Comment.objects.filter(content_id=content_id, is_active=True).count()
+    return Content.objects.filter(pk=content_id).update(comment_count=count)
+
+
+def _count_subquery(model, **filters):
+    counts = model.objects.filter(content=OuterRef('pk'), **filters).order_by().values('content').annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def reconcile_counters(batch_size=RECONCILE_BATCH_SIZE):
+    """
+    Recompute bookmark and comment counters for every Content row.
+    Only rows whose stored counters differ are updated, one UPDATE per batch.
+    Returns counts of rows checked and fixed.
+    """
+    bookmark_total = _count_subquery(Bookmark)
+    comment_total = _count_subquery(Comment, is_active=True)
+
+    checked = 0
+    fixed = 0
+    last_pk = None
+    while True:
+        batch = Content.objects.order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        pks = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+        checked += len(pks)
+
+        stale = Content.objects.filter(pk__in=pks).annotate(
+            actual_bookmarks=bookmark_total,
+            actual_comments=comment_total,
+        ).filter(
+            ~Q(bookmark_count=F('actual_bookmarks')) | ~Q(comment_count=F('actual_comments'))
+        ).values_list('pk', flat=True)
+        fixed += Content.objects.filter(pk__in=list(stale)).update(
+            bookmark_count=bookmark_total,
+            comment_count=comment_total,
+        )
+
+    return {
+        'checked': checked,
+        'fixed': fixed,
+    }
@@ -0,0 +1,96 @@
+"""
+Cached resolution of the daily quote.
+
+The quote shown on the homepage is resolved and serialized once per UTC
+day and cached until the next midnight. Creating or changing a quotation
+(admin create, generate_daily_quote, approval) invalidates it by bumping
+the 'daily_quote' cache namespace in the shared cache, which reaches web
+workers when the write happens in Celery. Until today's quote exists, the
+fallback is only cached for DAILY_QUOTE_FALLBACK_TIMEOUT so a missed
+invalidation cannot pin yesterday's quote for the whole day.
+"""
+import hashlib
+import json
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from apps.core.cache import bump_namespace, get_or_set, make_key
+from .models import Content
+from .serializers import ContentSerializer
+
+DAILY_QUOTE_NAMESPACE = 'daily_quote'
+DAILY_QUOTE_FALLBACK_TIMEOUT = 300
+
+
+def _today_bounds(now=None):
+    """Get the start of the current UTC day and the next UTC midnight."""
+    now = (now or timezone.now()).astimezone(dt_timezone.utc)
+    start = datetime.combine(now.date(), time.min, tzinfo=dt_timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def get_daily_quote_key(now=None):
+    """Build the cache key for today's quote."""
+    start, _ = _today_bounds(now)
+    return make_key(DAILY_QUOTE_NAMESPACE, start.date().isoformat())
+
+
+def resolve_daily_quote():
+    """
+    Get today's quote, falling back to the latest quote.
+    Uses a published_at range so the (content_type, published_at) index applies.
+    """
+    start, end = _today_bounds()
+    quote = Content.objects.filter(
+        content_type='QUOTATION',
+        is_active=True,
+        published_at__gte=start,
+        published_at__lt=end
+    ).with_authors().first()
+
+    if not quote:
+        # Fallback to latest quote
+        quote = Content.objects.filter(
+            content_type='QUOTATION',
+            is_active=True
+        ).with_authors().order_by('-published_at').first()
+
+    return quote
+
+
+def get_daily_quote_payload():
+    """
+    Get today's serialized quote with its ETag and Last-Modified stamp.
+    Returns None when there is no quote. Today's quote is cached until the
+    next UTC midnight, a fallback to an older quote for a few minutes.
+    """
+    now = timezone.now()
+    start, next_midnight = _today_bounds(now)
+
+    def build():
+        quote = resolve_daily_quote()
+        if quote is None:
+            return None
+
+        # Serialized without a request: is_bookmarked is resolved per user by the view
+        data = dict(ContentSerializer(quote).data)
+        digest = hashlib.md5(json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode('utf-8')).hexdigest()
+        return {
+            'data': data,
+            'etag': digest,
+            'last_modified': int(timezone.now().timestamp()),
+            'is_today': quote.published_at >= start,
+        }
+
+    def timeout(payload):
+        until_midnight = max(1, int((next_midnight - now).total_seconds()))
+        if payload is None or not payload['is_today']:
+            return min(DAILY_QUOTE_FALLBACK_TIMEOUT, until_midnight)
+        return until_midnight
+
+    return get_or_set(get_daily_quote_key(now), build, timeout)
+
+
+def invalidate_daily_quote():
+    """Drop today's cached quote so the next request resolves it again."""
+    bump_namespace(DAILY_QUOTE_NAMESPACE)
@@ -0,0 +1,97 @@
+"""
+Materialized per-audience content feeds.
+
+Each (content_type, grade, school) audience gets an ordered list of
+approved content IDs kept in the Django cache. Feed pages are served by
+slicing that list and loading only the rows on the page. Any write that
+can change a feed bumps a global feed version, so stale lists are never
+read again and simply expire. Keys live in the 'feed' namespace of
+apps.core.cache, and rebuilds go through its stampede-safe get_or_set().
+"""
+import hashlib
+import logging
+from django.conf import settings
+from django.utils import timezone
+from apps.core.cache import bump_namespace, get_namespace_version, get_or_set, make_key
+from .models import Content
+
+logger = logging.getLogger(__name__)
+
+FEED_NAMESPACE = 'feed'
+
+
+def _feed_timeout():
+    return getattr(settings, 'FEED_CACHE_TIMEOUT', 300)
+
+
+def _feed_max_items():
+    return getattr(settings, 'FEED_CACHE_MAX_ITEMS', 500)
+
+
+def get_feed_version():
+    """Get the current feed version, initialising it if needed."""
+    return get_namespace_version(FEED_NAMESPACE)
+
+
+def invalidate_feeds():
+    """Invalidate every materialized feed by bumping the feed version."""
+    bump_namespace(FEED_NAMESPACE)
+
+
+def get_feed_key(content_type, grade=None, school=None):
+    """Build the cache key for an audience feed."""
+    if content_type == 'MIXED':
+        content_type = 'MOTIVATION'
+    school_digest = hashlib.md5((school or '').encode('utf-8')).hexdigest()[:16]
+    return make_key(FEED_NAMESPACE, content_type, grade or 0, school_digest)
+
+
+def get_feed_entries(content_type, grade=None, school=None):
+    """
+    Get the materialized feed for an audience.
+    Returns a list of (content_id, published_at_timestamp) newest first.
+    """
+    def build():
+        rows = Content.get_audience_queryset(
+            content_type=content_type,
+            grade=grade,
+            school=school,
+        ).order_by('-published_at', '-id').values_list('id', 'published_at')[:_feed_max_items()]
+        return [(str(content_id), published_at.timestamp()) for content_id, published_at in rows]
+
+    return get_or_set(get_feed_key(content_type, grade, school), build, _feed_timeout())
+
+
+def get_visible_feed_ids(entries):
+    """Get the IDs of feed entries whose publish time has passed."""
+    # Scheduled items stay in the list until their publish time has passed
+    now = timezone.now().timestamp()
+    return [content_id for content_id, published_at in entries if published_at <= now]
+
+
+def is_feed_window_full(entries):
+    """Check if a feed was cut off at the materialized window, so older items exist past it."""
+    return len(entries) >= _feed_max_items()
+
+
+def get_feed_page(user, content_type='MOTIVATION', limit=20, offset=0):
+    """
+    Get a page of feed content for a user.
+    Falls back to the database query for pages past the materialized window.
+    """
+    entries = get_feed_entries(content_type, user.grade, user.school)
+    visible_ids = get_visible_feed_ids(entries)
+
+    if offset + limit > len(visible_ids) and is_feed_window_full(entries):
+        return list(Content.get_content_for_user(
+            user=user,
+            content_type=content_type,
+            limit=limit,
+            offset=offset
+        ))
+
+    page_ids = visible_ids[offset:offset + limit]
+    # A cached list can still hold items deactivated or unapproved since it was built
+    rows = Content.objects.filter(is_active=True, approval_status='approved').with_authors().in_bulk(page_ids)
+    content_by_id = {str(pk): content for pk, content in rows.items()}
+    return [content_by_id[content_id] for content_id in page_ids if content_id in content_by_id]
@@ -0,0 +1,57 @@
+"""
+Bulk content ingestion with hash-based deduplication.
+"""
+import logging
+from typing import Dict, Iterable, List
+from django.db import transaction
+from .daily_quote import invalidate_daily_quote
+from .feeds import invalidate_feeds
+from .models import Content
+
+logger = logging.getLogger(__name__)
+
+INGEST_BATCH_SIZE = 500
+
+
+def ingest_content(items: Iterable[Content], batch_size: int = INGEST_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Insert unsaved Content instances, skipping duplicates by hash.
+
+    Hashes are resolved against the database with one IN query per batch,
+    and the survivors are inserted with bulk_create in a single transaction.
+    Returns counts of created and duplicate items.
+    """
+    unique: Dict[str, Content] = {}
+    duplicates = 0
+    for item in items:
+        if not item.hash:
+            item.hash = item.generate_hash()
+        if item.hash in unique:
+            duplicates += 1
+            continue
+        unique[item.hash] = item
+
+    hashes = list(unique)
+    existing = set()
+    for start in range(0, len(hashes), batch_size):
+        existing.update(
+            Content.objects.filter(hash__in=hashes[start:start + batch_size]).values_list('hash', flat=True)
+        )
+
+    survivors: List[Content] = [item for content_hash, item in unique.items() if content_hash not in existing]
+    duplicates += len(existing)
+
+    if survivors:
+        with transaction.atomic():
+            # ignore_conflicts covers rows inserted concurrently since the hash lookup
+            Content.objects.bulk_create(survivors, batch_size=batch_size, ignore_conflicts=True)
+        # bulk_create skips save signals, so invalidate feeds here
+        invalidate_feeds()
+        if any(item.content_type == 'QUOTATION' for item in survivors):
+            invalidate_daily_quote()
+
+    logger.info(f"Ingested {len(survivors)} content items, skipped {duplicates} duplicates")
+    return {
+        'created': len(survivors),
+        'duplicates': duplicates,
+    }
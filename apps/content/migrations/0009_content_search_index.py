@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# Frozen copies of the statements in apps.content.search, so later edits to
+# that module cannot change what this migration does.
+SQLITE_CREATE_SQL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS content_search USING fts5(title, body, tokenize='porter unicode61')",
+    """CREATE TRIGGER IF NOT EXISTS content_search_ai AFTER INSERT ON content BEGIN
+        INSERT INTO content_search(rowid, title, body) VALUES (new.rowid, coalesce(new.title, ''), new.body);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS content_search_ad AFTER DELETE ON content BEGIN
+        DELETE FROM content_search WHERE rowid = old.rowid;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS content_search_au AFTER UPDATE OF title, body ON content BEGIN
+        DELETE FROM content_search WHERE rowid = old.rowid;
+        INSERT INTO content_search(rowid, title, body) VALUES (new.rowid, coalesce(new.title, ''), new.body);
+    END""",
+    "DELETE FROM content_search",
+    "INSERT INTO content_search(rowid, title, body) SELECT rowid, coalesce(title, ''), body FROM content",
+]
+SQLITE_DROP_SQL = [
+    "DROP TRIGGER IF EXISTS content_search_au",
+    "DROP TRIGGER IF EXISTS content_search_ad",
+    "DROP TRIGGER IF EXISTS content_search_ai",
+    "DROP TABLE IF EXISTS content_search",
+]
+POSTGRES_CREATE_SQL = [
+    "CREATE INDEX IF NOT EXISTS content_search_gin ON content "
+    "USING GIN ((to_tsvector('english', coalesce(title, '') || ' ' || body)))",
+]
+POSTGRES_DROP_SQL = [
+    "DROP INDEX IF EXISTS content_search_gin",
+]
+
+
+def run_for_vendor(sqlite_statements, postgres_statements):
+    def operation(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        statements = {'sqlite': sqlite_statements, 'postgresql': postgres_statements}.get(vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_alter_content_content_type'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor(SQLITE_CREATE_SQL, POSTGRES_CREATE_SQL),
+            run_for_vendor(SQLITE_DROP_SQL, POSTGRES_DROP_SQL),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-17 22:58
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Content = apps.get_model('content', 'Content')
+    Bookmark = apps.get_model('content', 'Bookmark')
+    Comment = apps.get_model('content', 'Comment')
+
+    def total(model, **filters):
+        counts = model.objects.filter(content=OuterRef('pk'), **filters).order_by().values('content').annotate(
+            total=Count('pk')
+        ).values('total')
+        return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+    Content.objects.update(
+        bookmark_count=total(Bookmark),
+        comment_count=total(Comment, is_active=True),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0009_content_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='content',
+            name='bookmark_count',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized number of bookmarks'),
+        ),
+        migrations.AddField(
+            model_name='content',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized number of active comments'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
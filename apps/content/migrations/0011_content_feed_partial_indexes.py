@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_content_engagement_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='content',
+            name='content_hash_2aae72_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='content',
+            name='content_target__83a102_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='content',
+            name='content_target__ff115a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(condition=models.Q(('approval_status', 'approved'), ('is_active', True)), fields=['content_type', '-published_at', '-id'], name='content_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(condition=models.Q(('approval_status', 'pending')), fields=['-created_at'], name='content_pending_idx'),
+        ),
+    ]
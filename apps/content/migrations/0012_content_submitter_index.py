@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 23:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0011_content_feed_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['submitted_by', '-created_at', '-id'], name='content_submitter_idx'),
+        ),
+    ]
@@ -4,12 +4,49 @@ Content models for the motivation news application.
 import uuid
 import hashlib
 from django.db import models
+from django.db.models.functions import Substr
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
 
+class ContentQuerySet(models.QuerySet):
+    """
+    QuerySet for Content with helpers for serializer-friendly fetching.
+    """
+
+    def with_authors(self):
+        """Fetch the creating and submitting users in the base query."""
+        return self.select_related('created_by', 'submitted_by')
+
+    def approval_counts(self):
+        """Count rows per approval status, plus the total, in one aggregate query."""
+        return self.aggregate(
+            total=models.Count('pk'),
+            **{
+                value: models.Count('pk', filter=models.Q(approval_status=value))
+                for value, _ in Content.APPROVAL_STATUS_CHOICES
+            }
+        )
+
+    def summarized(self, excerpt_length=200):
+        """Defer the large text columns and annotate a short body `excerpt`."""
+        return self.defer('body', 'rich_content', 'rejection_reason').annotate(
+            excerpt=Substr('body', 1, excerpt_length)
+        )
+
+
+class CommentQuerySet(models.QuerySet):
+    """
+    QuerySet for Comment with helpers for serializer-friendly fetching.
+    """
+
+    def with_user(self):
+        """Fetch the commenting user in the base query."""
+        return self.select_related('user')
+
+
 class Content(models.Model):
     """
     Model for storing motivational content (news, jokes, quotations, stories).
@@ -62,15 +99,31 @@ class Content(models.Model):
     rejection_reason = models.TextField(null=True, blank=True, help_text="Reason for rejection if content was rejected")
     resubmission_status = models.CharField(max_length=20, choices=RESUBMISSION_STATUS_CHOICES, default='none')
     original_submission = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, blank=True, related_name='resubmissions')
+    bookmark_count = models.PositiveIntegerField(default=0, help_text="Denormalized number of bookmarks")
+    comment_count = models.PositiveIntegerField(default=0, help_text="Denormalized number of active comments")
+
+    objects = ContentQuerySet.as_manager()
     
     class Meta:
         db_table = 'content'
         ordering = ['-published_at']
         indexes = [
+            # Daily quote lookup, which does not filter on approval
             models.Index(fields=['content_type', 'published_at']),
-            models.Index(fields=['target_grade', 'content_type']),
-            models.Index(fields=['target_school', 'content_type']),
-            models.Index(fields=['hash']),
+            # Audience feeds: approved, active content of a type, newest first
+            models.Index(
+                fields=['content_type', '-published_at', '-id'],
+                name='content_feed_idx',
+                condition=models.Q(is_active=True, approval_status='approved'),
+            ),
+            # Admin review queue, newest first
+            models.Index(
+                fields=['-created_at'],
+                name='content_pending_idx',
+                condition=models.Q(approval_status='pending'),
+            ),
+            # A user's own submissions, newest first
+            models.Index(fields=['submitted_by', '-created_at', '-id'], name='content_submitter_idx'),
         ]
         verbose_name = 'Content'
         verbose_name_plural = 'Content'
@@ -90,39 +143,49 @@ class Content(models.Model):
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
     
     @classmethod
-    def get_content_for_user(cls, user, content_type='MOTIVATION', limit=20, offset=0):
+    def get_audience_queryset(cls, content_type='MOTIVATION', grade=None, school=None):
         """
-        Get content filtered for a specific user's grade and school.
-        Only shows approved content.
+        Get approved, active content of a type visible to a grade/school audience.
+        Pass content_type=None for every type.
+        Scheduled items (published_at in the future) are included.
         """
         if content_type == 'MIXED':
             # For MIXED content, get from MOTIVATION content type for homepage
-            queryset = cls.objects.filter(
-                content_type='MOTIVATION',
-                is_active=True,
-                approval_status='approved',  # Only show approved content
-                published_at__lte=timezone.now()
-            )
-        else:
-            queryset = cls.objects.filter(
-                content_type=content_type,
-                is_active=True,
-                approval_status='approved',  # Only show approved content
-                published_at__lte=timezone.now()
-            )
-        
+            content_type = 'MOTIVATION'
+
+        queryset = cls.objects.filter(
+            is_active=True,
+            approval_status='approved',  # Only show approved content
+        )
+        if content_type is not None:
+            queryset = queryset.filter(content_type=content_type)
+
         # Filter by grade if user has a grade
-        if user.grade:
+        if grade:
             queryset = queryset.filter(
-                models.Q(target_grade__isnull=True) | models.Q(target_grade=user.grade)
+                models.Q(target_grade__isnull=True) | models.Q(target_grade=grade)
             )
 
         # Filter by school if user has a school
-        if user.school:
+        if school:
             queryset = queryset.filter(
-                models.Q(target_school__isnull=True) | models.Q(target_school=user.school)
+                models.Q(target_school__isnull=True) | models.Q(target_school=school)
             )
 
+        return queryset
+
+    @classmethod
+    def get_content_for_user(cls, user, content_type='MOTIVATION', limit=20, offset=0):
+        """
+        Get content filtered for a specific user's grade and school.
+        Only shows approved content.
+        """
+        queryset = cls.get_audience_queryset(
+            content_type=content_type,
+            grade=user.grade,
+            school=user.school,
+        ).filter(published_at__lte=timezone.now()).with_authors()
+
         return queryset[offset:offset + limit]
 
 
@@ -138,6 +201,8 @@ class Comment(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         db_table = 'comment'
         ordering = ['-created_at']
@@ -0,0 +1,97 @@
+"""
+Bulk moderation of the pending submission queue.
+
+A batch is applied with one UPDATE ... WHERE id IN (...) AND
+approval_status = 'pending', so items already reviewed by another moderator
+are left alone. A second query reads the batch back to report an outcome per
+item. Feeds and the daily quote are invalidated once per batch instead of
+once per item, since the bulk UPDATE bypasses the Content save signals.
+"""
+import logging
+import uuid
+from django.utils import timezone
+from .models import Content
+from .feeds import invalidate_feeds
+from .daily_quote import invalidate_daily_quote
+
+logger = logging.getLogger(__name__)
+
+MAX_MODERATION_BATCH = 500
+
+ACTIONS = {
+    'approve': 'approved',
+    'reject': 'rejected',
+}
+
+
+def parse_content_ids(values):
+    """
+    Split raw IDs into unique valid UUIDs and invalid entries, keeping order.
+    Returns (ids, invalid).
+    """
+    ids = []
+    invalid = []
+    seen = set()
+    for value in values:
+        try:
+            content_id = uuid.UUID(str(value))
+        except ValueError:
+            invalid.append(value)
+            continue
+        if content_id not in seen:
+            seen.add(content_id)
+            ids.append(content_id)
+    return ids, invalid
+
+
+def moderate_submissions(content_ids, reviewer, action, rejection_reason=None):
+    """
+    Approve or reject pending submissions in one UPDATE.
+
+    Returns a list of per-item outcomes in request order. Each has the
+    content_id and a result: 'approved', 'rejected', 'not_found', or
+    'not_pending' with the item's current approval_status.
+    """
+    approval_status = ACTIONS[action]
+    reviewed_at = timezone.now()
+    changes = {
+        'approval_status': approval_status,
+        'is_active': approval_status == 'approved',
+        'reviewed_by': reviewer,
+        'reviewed_at': reviewed_at,
+    }
+    if approval_status == 'rejected':
+        changes['rejection_reason'] = rejection_reason
+
+    updated = Content.objects.filter(pk__in=content_ids, approval_status='pending').update(**changes)
+
+    rows = {
+        row['id']: row
+        for row in Content.objects.filter(pk__in=content_ids).values(
+            'id', 'approval_status', 'content_type', 'reviewed_by', 'reviewed_at',
+        )
+    }
+    results = []
+    moderated_types = set()
+    for content_id in content_ids:
+        row = rows.get(content_id)
+        if row is None:
+            results.append({'content_id': str(content_id), 'result': 'not_found'})
+        elif row['reviewed_at'] == reviewed_at and row['reviewed_by'] == reviewer.pk:
+            moderated_types.add(row['content_type'])
+            results.append({'content_id': str(content_id), 'result': approval_status})
+        else:
+            results.append({
+                'content_id': str(content_id),
+                'result': 'not_pending',
+                'approval_status': row['approval_status'],
+            })
+
+    # Pending items are in no feed, so only approvals change what readers see
+    if approval_status == 'approved' and moderated_types:
+        invalidate_feeds()
+        if 'QUOTATION' in moderated_types:
+            invalidate_daily_quote()
+
+    logger.info(f"Admin {reviewer.email} {approval_status} {updated} of {len(content_ids)} submissions")
+    return results
@@ -0,0 +1,168 @@
+"""
+Pagination classes for content app.
+"""
+import base64
+import hashlib
+import json
+import uuid
+from collections import OrderedDict
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.dateparse import parse_datetime
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from apps.core.cache import get_or_set, make_key
+
+COUNT_NAMESPACE = 'content_count'
+
+
+def is_cursor_request(request):
+    """Check if the client asked for cursor (keyset) pagination."""
+    params = request.query_params
+    return 'cursor' in params or params.get('pagination') == 'cursor'
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Keyset pagination over a descending (timestamp, id) ordering.
+
+    The cursor is an opaque token holding the (timestamp, id) of the last
+    row on the previous page, so every page is a bounded index range scan
+    and rows do not shift when new items are published mid-scroll.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'limit'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, ordering=('-published_at', '-id')):
+        self.ordering = ordering
+        self.field = ordering[0].lstrip('-')
+        self.tiebreaker = ordering[1].lstrip('-')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return one page of results after the requested cursor position."""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            value, key = position
+            queryset = queryset.filter(
+                Q(**{f'{self.field}__lt': value}) |
+                Q(**{self.field: value, f'{self.tiebreaker}__lt': key})
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        self.next_position = None
+        if self.has_next:
+            last = results[-1]
+            self.next_position = (getattr(last, self.field), getattr(last, self.tiebreaker))
+        return results
+
+    def get_page_size(self, request):
+        """Get the page size from the request, capped at max_page_size."""
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        """Decode the opaque cursor into a (timestamp, id) position."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+            value = parse_datetime(data['t'])
+            # Every keyset ordering here breaks ties on a UUID primary key
+            key = uuid.UUID(data['k'])
+        except (TypeError, ValueError, KeyError, AttributeError):
+            raise NotFound(self.invalid_cursor_message)
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return value, key
+
+    def encode_cursor(self, position):
+        """Encode a (timestamp, id) position into an opaque cursor."""
+        value, key = position
+        data = json.dumps({'t': value.isoformat(), 'k': str(key)}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def get_next_link(self):
+        """Get the URL for the next page, or None on the last page."""
+        if self.next_position is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+
+class CursorPaginationMixin:
+    """
+    Switch a list view to keyset pagination when the client sends a cursor.
+    Requests without a cursor keep the view's default pagination.
+    """
+    cursor_ordering = ('-published_at', '-id')
+
+    def is_cursor_mode(self):
+        return is_cursor_request(self.request)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator') and self.is_cursor_mode():
+            self._paginator = KeysetPagination(ordering=self.cursor_ordering)
+        return super().paginator
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator whose total count is cached per query for CONTENT_COUNT_CACHE_TIMEOUT.
+    The count is approximate: rows added or removed since it was cached are not
+    reflected until it expires, but paging through a large table no longer
+    runs COUNT(*) on every page.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        digest = hashlib.md5(str(queryset.query).encode('utf-8')).hexdigest()
+        return get_or_set(
+            make_key(COUNT_NAMESPACE, queryset.db, digest),
+            queryset.count,
+            getattr(settings, 'CONTENT_COUNT_CACHE_TIMEOUT', 60),
+        )
+
+
+class CachedCountPagination(pagination.PageNumberPagination):
+    """Page number pagination with a cached total count and a client page size."""
+    django_paginator_class = CachedCountPaginator
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -0,0 +1,159 @@
+"""
+Full-text search over Content.
+
+SQLite uses an FTS5 table (content_search) keyed by the content row's
+rowid and kept in sync by triggers. PostgreSQL uses a GIN index on the
+tsvector of title and body. Both are maintained by the database on every
+insert/update/delete, including bulk_create and queryset updates, so the
+index never needs application-side bookkeeping. Visibility rules
+(approval, grade, school, publish time) are applied at query time.
+"""
+import re
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = 'content_search'
+SEARCH_CONFIG = 'english'
+# Must match the expression of the GIN index in migration 0009, which keeps its own copy of this SQL
+SEARCH_DOCUMENT_SQL = f"to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || body)"
+
+SQLITE_CREATE_SQL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(title, body, tokenize='porter unicode61')",
+    f"""CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON content BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, body) VALUES (new.rowid, coalesce(new.title, ''), new.body);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON content BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.rowid;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au AFTER UPDATE OF title, body ON content BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.rowid;
+        INSERT INTO {SEARCH_TABLE}(rowid, title, body) VALUES (new.rowid, coalesce(new.title, ''), new.body);
+    END""",
+]
+SQLITE_REBUILD_SQL = [
+    f"DELETE FROM {SEARCH_TABLE}",
+    f"INSERT INTO {SEARCH_TABLE}(rowid, title, body) SELECT rowid, coalesce(title, ''), body FROM content",
+]
+POSTGRES_CREATE_SQL = [
+    f"CREATE INDEX IF NOT EXISTS content_search_gin ON content USING GIN (({SEARCH_DOCUMENT_SQL}))",
+]
+POSTGRES_REBUILD_SQL = [
+    "REINDEX INDEX content_search_gin",
+]
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def build_fts_query(text):
+    """
+    Turn user input into an FTS5 query of quoted terms (implicit AND).
+    The last term matches as a prefix so results follow the user's typing.
+    """
+    terms = _TERM_RE.findall(text)
+    if not terms:
+        return ''
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def ensure_search_index(using='default'):
+    """
+    Recreate the SQLite triggers and FTS rows if they are missing.
+    SQLite migrations that rebuild the content table drop its triggers and
+    renumber rowids, so this runs after every migrate.
+    """
+    conn = connections[using]
+    if conn.vendor != 'sqlite':
+        return False
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+            [f'{SEARCH_TABLE}_%'],
+        )
+        if cursor.fetchone()[0] == len(SQLITE_CREATE_SQL) - 1:
+            return False
+        for statement in SQLITE_CREATE_SQL + SQLITE_REBUILD_SQL:
+            cursor.execute(statement)
+    return True
+
+
+def rebuild_search_index(using='default'):
+    """
+    Rebuild the search index from the content table.
+    On SQLite this recreates any missing triggers and repopulates the FTS
+    table, which goes stale when VACUUM renumbers the content rowids.
+    On PostgreSQL it creates the GIN index if missing and reindexes it.
+    Returns False on other backends, which have no index.
+    """
+    conn = connections[using]
+    if conn.vendor == 'sqlite':
+        statements = SQLITE_CREATE_SQL + SQLITE_REBUILD_SQL
+    elif conn.vendor == 'postgresql':
+        statements = POSTGRES_CREATE_SQL + POSTGRES_REBUILD_SQL
+    else:
+        return False
+    with conn.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+    return True
+
+
+def match_content(queryset, text):
+    """
+    Filter a Content queryset to rows matching text, without ranking.
+    The condition names no table, so it stays uncorrelated when the
+    queryset is nested in a subquery (e.g. pk__in=...values('pk')).
+    Returns an empty queryset for input without searchable terms.
+    """
+    if not _TERM_RE.search(text or ''):
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        return queryset.extra(
+            where=[f'rowid IN (SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s)'],
+            params=[build_fts_query(text)],
+        )
+
+    if vendor == 'postgresql':
+        return queryset.extra(
+            where=[f"{SEARCH_DOCUMENT_SQL} @@ websearch_to_tsquery('{SEARCH_CONFIG}', %s)"],
+            params=[text],
+        )
+
+    # Other backends have no index: fall back to substring matching
+    condition = Q()
+    for term in _TERM_RE.findall(text):
+        condition &= Q(title__icontains=term) | Q(body__icontains=term)
+    return queryset.filter(condition)
+
+
+def search_content(queryset, text):
+    """
+    Filter a Content queryset to rows matching text, ranked best first.
+    The SQLite ranking joins the FTS table on content.rowid, so filters
+    used inside another query should be built with match_content().
+    Returns an empty queryset for input without searchable terms.
+    """
+    if not _TERM_RE.search(text or ''):
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        # Join the FTS table on rowid; bm25() is lower for better matches
+        return queryset.extra(
+            tables=[SEARCH_TABLE],
+            where=[f'{SEARCH_TABLE}.rowid = content.rowid', f'{SEARCH_TABLE} MATCH %s'],
+            params=[build_fts_query(text)],
+            select={'search_rank': f'bm25({SEARCH_TABLE})'},
+        ).order_by('search_rank', '-published_at')
+
+    if vendor == 'postgresql':
+        tsquery = f"websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+        return match_content(queryset, text).annotate(
+            search_rank=RawSQL(f"ts_rank({SEARCH_DOCUMENT_SQL}, {tsquery})", (text,))
+        ).order_by('-search_rank', '-published_at')
+
+    return match_content(queryset, text)
@@ -34,6 +34,32 @@ class CommentSerializer(serializers.ModelSerializer):
             return f"{obj.user.first_name} {obj.user.last_name}".strip()
         return 'Anonymous'
 
+def get_bookmarked_ids(request, content_ids):
+    """Get the subset of content IDs bookmarked by the requesting user in one query."""
+    if not request or not request.user.is_authenticated or not content_ids:
+        return set()
+    return set(
+        Bookmark.objects.filter(
+            user=request.user,
+            content_id__in=content_ids
+        ).values_list('content_id', flat=True)
+    )
+
+
+class ContentListSerializer(serializers.ListSerializer):
+    """
+    List serializer that resolves is_bookmarked for the whole page at once.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        self.context['bookmarked_ids'] = get_bookmarked_ids(
+            self.context.get('request'),
+            [item.pk for item in items]
+        )
+        return super().to_representation(items)
+
+
 class ContentSerializer(serializers.ModelSerializer):
     """
     Serializer for Content model.
@@ -48,12 +74,22 @@ class ContentSerializer(serializers.ModelSerializer):
             'id', 'content_type', 'title', 'body', 'rich_content', 'youtube_url', 'news_url',
             'target_grade', 'target_school', 'source', 'published_at',
             'created_at', 'is_bookmarked', 'is_active', 'created_by', 'submitted_by',
-            'submitted_by_name', 'created_by_name', 'approval_status', 'reviewed_by', 'reviewed_at'
+            'submitted_by_name', 'created_by_name', 'approval_status', 'reviewed_by', 'reviewed_at',
+            'bookmark_count', 'comment_count'
         ]
-        read_only_fields = ['id', 'created_at', 'hash', 'is_active', 'created_by', 'submitted_by', 'reviewed_by', 'reviewed_at']
+        read_only_fields = [
+            'id', 'created_at', 'hash', 'is_active', 'created_by', 'submitted_by', 'reviewed_by', 'reviewed_at',
+            'bookmark_count', 'comment_count'
+        ]
+        list_serializer_class = ContentListSerializer
     
     def get_is_bookmarked(self, obj):
         """Check if current user has bookmarked this content."""
+        # Resolved for the whole page by the list serializer when available
+        bookmarked_ids = self.context.get('bookmarked_ids')
+        if bookmarked_ids is not None:
+            return obj.pk in bookmarked_ids
+
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return obj.bookmarks.filter(user=request.user).exists()
@@ -72,6 +108,28 @@ class ContentSerializer(serializers.ModelSerializer):
         return None
 
 
+class ContentSummarySerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for admin listings.
+    Expects querysets with body and rich_content deferred and an `excerpt` annotation.
+    """
+    excerpt = serializers.CharField(read_only=True)
+    submitted_by_name = serializers.SerializerMethodField()
+    created_by_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Content
+        fields = [
+            'id', 'content_type', 'title', 'excerpt', 'youtube_url', 'target_grade', 'target_school', 'source',
+            'published_at', 'created_at', 'is_active', 'approval_status', 'created_by', 'submitted_by',
+            'submitted_by_name', 'created_by_name', 'bookmark_count', 'comment_count'
+        ]
+        read_only_fields = fields
+
+    get_submitted_by_name = ContentSerializer.get_submitted_by_name
+    get_created_by_name = ContentSerializer.get_created_by_name
+
+
 class ContentCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating content (admin only).
@@ -96,6 +154,21 @@ class ContentCreateSerializer(serializers.ModelSerializer):
         return value
 
 
+class BookmarkListSerializer(serializers.ListSerializer):
+    """
+    List serializer that marks nested content as bookmarked without extra queries.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        request = self.context.get('request')
+        user_id = request.user.pk if request and request.user.is_authenticated else None
+        self.context['bookmarked_ids'] = {
+            item.content_id for item in items if item.user_id == user_id
+        }
+        return super().to_representation(items)
+
+
 class BookmarkSerializer(serializers.ModelSerializer):
     """
     Serializer for Bookmark model.
@@ -106,3 +179,4 @@ class BookmarkSerializer(serializers.ModelSerializer):
         model = Bookmark
         fields = ['id', 'content', 'created_at']
         read_only_fields = ['id', 'created_at']
+        list_serializer_class = BookmarkListSerializer
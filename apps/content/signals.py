@@ -0,0 +1,81 @@
+"""
+Signal handlers for content app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Content, Comment, Bookmark
+from .conditional import bump_version_stamp
+from .counters import adjust_counter, refresh_comment_count
+from .feeds import invalidate_feeds
+from .search import ensure_search_index
+from .daily_quote import invalidate_daily_quote
+
+
+@receiver(post_save, sender=Content)
+def content_saved(sender, instance, created, **kwargs):
+    """Invalidate feeds when content is created, approved, rejected or updated."""
+    if created and instance.approval_status != 'approved':
+        # New pending submissions are not visible in any feed yet
+        return
+    invalidate_feeds()
+    if instance.content_type == 'QUOTATION':
+        invalidate_daily_quote()
+
+
+@receiver(post_delete, sender=Content)
+def content_deleted(sender, instance, **kwargs):
+    """Invalidate feeds when content is deleted."""
+    invalidate_feeds()
+    if instance.content_type == 'QUOTATION':
+        invalidate_daily_quote()
+
+
+@receiver(post_save, sender=Bookmark)
+def bookmark_saved(sender, instance, created, **kwargs):
+    """Count new bookmarks and move the user's bookmark version."""
+    if created:
+        adjust_counter(instance.content_id, 'bookmark_count', 1)
+    bookmark_changed(instance)
+
+
+@receiver(post_delete, sender=Bookmark)
+def bookmark_deleted(sender, instance, **kwargs):
+    """Uncount removed bookmarks and move the user's bookmark version."""
+    adjust_counter(instance.content_id, 'bookmark_count', -1)
+    bookmark_changed(instance)
+
+
+def bookmark_changed(instance):
+    """Move the user's bookmark version and the item's engagement version."""
+    bump_version_stamp(f"bookmarks:{instance.user_id}")
+    bump_version_stamp(f"engagement:{instance.content_id}")
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    """Count new active comments, recount on edits that may toggle is_active."""
+    if created:
+        if instance.is_active:
+            adjust_counter(instance.content_id, 'comment_count', 1)
+    else:
+        refresh_comment_count(instance.content_id)
+    comment_changed(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    """Uncount removed active comments."""
+    if instance.is_active:
+        adjust_counter(instance.content_id, 'comment_count', -1)
+    comment_changed(instance)
+
+
+def comment_changed(instance):
+    """Move the item's comment and engagement versions."""
+    bump_version_stamp(f"comments:{instance.content_id}")
+    bump_version_stamp(f"engagement:{instance.content_id}")
+
+
+def restore_search_index(sender, using='default', **kwargs):
+    """Recreate SQLite search triggers dropped by table rebuilds during migrate."""
+    ensure_search_index(using)
@@ -4,14 +4,20 @@ Views for user content submission and admin approval.
 from django.utils import timezone
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from .models import Content
-from .serializers import ContentSerializer, ContentCreateSerializer
+from .serializers import ContentSerializer, ContentCreateSerializer, ContentSummarySerializer
 from .permissions import IsAdminOrReadOnly
+from .pagination import KeysetPagination, is_cursor_request
+from .moderation import MAX_MODERATION_BATCH, moderate_submissions, parse_content_ids
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Requests without a cursor get at most this many rows, newest first
+UNPAGINATED_SUBMISSIONS_LIMIT = 100
+
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
@@ -89,16 +95,48 @@ def submit_story(request):
 @permission_classes([permissions.IsAuthenticated])
 def get_my_submissions(request):
     """
-    Get all submissions by the current user.
+    Get submissions by the current user, newest first, optionally by `status`.
+    Pass a `cursor` parameter for keyset pagination with `next` links and
+    per-status `counts`, and view=summary for truncated bodies.
+    Without a cursor only the newest UNPAGINATED_SUBMISSIONS_LIMIT are returned.
     """
     try:
-        submissions = Content.objects.filter(
-            submitted_by=request.user
-        ).order_by('-created_at')
+        own = Content.objects.filter(submitted_by=request.user)
+        submissions = own.with_authors().order_by('-created_at', '-id')
+
+        approval_status = request.query_params.get('status')
+        if approval_status:
+            if approval_status not in dict(Content.APPROVAL_STATUS_CHOICES):
+                return Response(
+                    {'error': f'Unknown status: {approval_status}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            submissions = submissions.filter(approval_status=approval_status)
+
+        serializer_class = ContentSerializer
+        if request.query_params.get('view') == 'summary':
+            submissions = submissions.summarized()
+            serializer_class = ContentSummarySerializer
+
+        if is_cursor_request(request):
+            paginator = KeysetPagination(ordering=('-created_at', '-id'))
+            page = paginator.paginate_queryset(submissions, request)
+            serializer = serializer_class(page, many=True, context={'request': request})
+            response = paginator.get_paginated_response(serializer.data)
+            # Counts cover every status so clients can label filter tabs
+            response.data['counts'] = own.approval_counts()
+            return response
         
-        serializer = ContentSerializer(submissions, many=True, context={'request': request})
+        serializer = serializer_class(
+            submissions[:UNPAGINATED_SUBMISSIONS_LIMIT], many=True, context={'request': request}
+        )
         return Response(serializer.data)
-        
+
+    except NotFound as e:
+        return Response(
+            {'error': str(e.detail)},
+            status=status.HTTP_404_NOT_FOUND
+        )
     except Exception as e:
         logger.error(f"Error fetching submissions: {str(e)}")
         return Response(
@@ -111,7 +149,11 @@ def get_my_submissions(request):
 @permission_classes([permissions.IsAuthenticated, IsAdminOrReadOnly])
 def get_pending_submissions(request):
     """
-    Get all pending submissions for admin review.
+    Get pending submissions for admin review, newest first.
+    Filters: content_type, grade, school. Pass a `cursor` parameter for keyset
+    pagination with `next` links, and view=summary for truncated bodies without
+    rich_content (fetch one item in full from the submission content endpoint).
+    Without a cursor only the newest UNPAGINATED_SUBMISSIONS_LIMIT are returned.
     """
     try:
         if not request.user.is_admin():
@@ -122,11 +164,52 @@ def get_pending_submissions(request):
         
         pending = Content.objects.filter(
             approval_status='pending'
-        ).order_by('-created_at')
+        ).with_authors().order_by('-created_at')
+
+        params = request.query_params
+        content_type = params.get('content_type')
+        if content_type:
+            if content_type not in dict(Content.CONTENT_TYPE_CHOICES):
+                return Response(
+                    {'error': f'Unknown content type: {content_type}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            pending = pending.filter(content_type=content_type)
+
+        grade = params.get('grade')
+        if grade:
+            try:
+                pending = pending.filter(target_grade=int(grade))
+            except ValueError:
+                return Response(
+                    {'error': 'Grade must be a number'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        if params.get('school'):
+            pending = pending.filter(target_school=params['school'])
+
+        serializer_class = ContentSerializer
+        if params.get('view') == 'summary':
+            pending = pending.summarized()
+            serializer_class = ContentSummarySerializer
+
+        if is_cursor_request(request):
+            paginator = KeysetPagination(ordering=('-created_at', '-id'))
+            page = paginator.paginate_queryset(pending, request)
+            serializer = serializer_class(page, many=True, context={'request': request})
+            return paginator.get_paginated_response(serializer.data)
         
-        serializer = ContentSerializer(pending, many=True, context={'request': request})
+        serializer = serializer_class(
+            pending[:UNPAGINATED_SUBMISSIONS_LIMIT], many=True, context={'request': request}
+        )
         return Response(serializer.data)
         
+    except NotFound as e:
+        return Response(
+            {'error': str(e.detail)},
+            status=status.HTTP_404_NOT_FOUND
+        )
     except Exception as e:
         logger.error(f"Error fetching pending submissions: {str(e)}")
         return Response(
@@ -135,6 +218,36 @@ def get_pending_submissions(request):
         )
 
 
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated, IsAdminOrReadOnly])
+def get_submission_content(request, content_id):
+    """
+    Get one submission in full, including rich content (admin only).
+    """
+    try:
+        if not request.user.is_admin():
+            return Response(
+                {'error': 'Admin access required'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        content = Content.objects.with_authors().get(id=content_id)
+        serializer = ContentSerializer(content, context={'request': request})
+        return Response(serializer.data)
+
+    except Content.DoesNotExist:
+        return Response(
+            {'error': 'Content not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    except Exception as e:
+        logger.error(f"Error fetching submission content: {str(e)}")
+        return Response(
+            {'error': 'Failed to fetch submission'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated, IsAdminOrReadOnly])
 def approve_submission(request, content_id):
@@ -226,6 +339,78 @@ def reject_submission(request, content_id):
         )
 
 
+def _bulk_moderate(request, action):
+    """Validate a bulk moderation request and apply it."""
+    if not request.user.is_admin():
+        return Response(
+            {'error': 'Admin access required'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    raw_ids = request.data.get('content_ids')
+    if not isinstance(raw_ids, list) or not raw_ids:
+        return Response(
+            {'error': 'content_ids must be a non-empty list'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(raw_ids) > MAX_MODERATION_BATCH:
+        return Response(
+            {'error': f'At most {MAX_MODERATION_BATCH} items can be moderated at once'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    rejection_reason = request.data.get('rejection_reason')
+    if action == 'reject' and not rejection_reason:
+        return Response(
+            {'error': 'Rejection reason is required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    content_ids, invalid = parse_content_ids(raw_ids)
+    results = moderate_submissions(content_ids, request.user, action, rejection_reason) if content_ids else []
+    results += [{'content_id': str(value), 'result': 'invalid_id'} for value in invalid]
+
+    moderated = sum(1 for item in results if item['result'] in ('approved', 'rejected'))
+    return Response({
+        'moderated': moderated,
+        'results': results,
+    })
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated, IsAdminOrReadOnly])
+def bulk_approve_submissions(request):
+    """
+    Approve many pending submissions at once (admin only).
+    Body: {"content_ids": [...]}. Returns an outcome per item.
+    """
+    try:
+        return _bulk_moderate(request, 'approve')
+    except Exception as e:
+        logger.error(f"Bulk approval error: {str(e)}")
+        return Response(
+            {'error': 'Failed to approve content'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated, IsAdminOrReadOnly])
+def bulk_reject_submissions(request):
+    """
+    Reject many pending submissions with one reason (admin only).
+    Body: {"content_ids": [...], "rejection_reason": "..."}. Returns an outcome per item.
+    """
+    try:
+        return _bulk_moderate(request, 'reject')
+    except Exception as e:
+        logger.error(f"Bulk rejection error: {str(e)}")
+        return Response(
+            {'error': 'Failed to reject content'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def resubmit_story(request, content_id):
@@ -11,6 +11,7 @@ urlpatterns = [
     path('', views.ContentListView.as_view(), name='content-list'),
     path('<uuid:id>/', views.ContentDetailView.as_view(), name='content-detail'),
     path('quote/', views.get_daily_quote, name='daily-quote'),
+    path('search/', views.ContentSearchView.as_view(), name='content-search'),
     path('<uuid:content_id>/bookmark/', views.toggle_bookmark, name='toggle-bookmark'),
     path('bookmarks/', views.BookmarkListView.as_view(), name='bookmark-list'),
     # Comment endpoints
@@ -27,6 +28,9 @@ urlpatterns = [
     path('admin/<uuid:pk>/update/', views.AdminContentUpdateView.as_view(), name='admin-content-update'),
     path('admin/<uuid:pk>/delete/', views.AdminContentDeleteView.as_view(), name='admin-content-delete'),
     path('admin/pending/', submission_views.get_pending_submissions, name='pending-submissions'),
+    path('admin/bulk-approve/', submission_views.bulk_approve_submissions, name='bulk-approve-submissions'),
+    path('admin/bulk-reject/', submission_views.bulk_reject_submissions, name='bulk-reject-submissions'),
+    path('admin/<uuid:content_id>/submission/', submission_views.get_submission_content, name='submission-content'),
     path('admin/<uuid:content_id>/approve/', submission_views.approve_submission, name='approve-submission'),
     path('admin/<uuid:content_id>/reject/', submission_views.reject_submission, name='reject-submission'),
     path('resubmit/<uuid:content_id>/', submission_views.resubmit_story, name='resubmit-story'),
@@ -1,30 +1,111 @@
 """
 Views for content app.
 """
+import uuid
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from datetime import datetime, time, timedelta
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from .models import Content, Comment, Bookmark
-from .serializers import ContentSerializer, ContentCreateSerializer, CommentSerializer, BookmarkSerializer
+from .serializers import (
+    ContentSerializer, ContentCreateSerializer, ContentSummarySerializer, CommentSerializer, BookmarkSerializer,
+)
 from .permissions import IsAdminOrReadOnly
+from .feeds import get_feed_entries, get_feed_page, get_feed_version, get_visible_feed_ids, is_feed_window_full
+from .pagination import CachedCountPagination, CursorPaginationMixin
+from .conditional import (
+    ConditionalGetMixin, get_not_modified_response, get_version_stamp, get_version_stamps, make_etag,
+    set_conditional_headers,
+)
+from .daily_quote import get_daily_quote_payload
+from .search import search_content
+from .bookmarks import get_bookmarked_content_ids, toggle_bookmark_for_user
 
 
-class ContentListView(generics.ListAPIView):
+def get_engagement_stamps(content_ids):
+    """Get the engagement version of each item, which moves on its bookmarks and comments."""
+    return get_version_stamps([f"engagement:{content_id}" for content_id in content_ids])
+
+
+class ContentListView(ConditionalGetMixin, CursorPaginationMixin, generics.ListAPIView):
     """
     List content with filtering and pagination.
+    Pass a `cursor` parameter for keyset pagination with `next` links.
     """
     serializer_class = ContentSerializer
     permission_classes = [permissions.IsAuthenticated]
+
+    def get_etag(self, request):
+        """
+        ETag from the feed version, visible feed size, the user's bookmarks and
+        the engagement of the items on the page.
+        Pages past the materialized feed window get no ETag.
+        """
+        user = request.user
+        content_type = request.query_params.get('content_type', 'MOTIVATION')
+        entries = get_feed_entries(content_type, user.grade, user.school)
+        page_ids = self.get_page_content_ids(entries)
+        if page_ids is None:
+            return None
+        # The visible count only grows as scheduled items reach their publish time
+        visible_count = len(get_visible_feed_ids(entries))
+        return make_etag(
+            'feed', user.pk, user.grade, user.school, get_feed_version(), visible_count,
+            get_version_stamp(f"bookmarks:{user.pk}"), *get_engagement_stamps(page_ids), request.get_full_path(),
+        )
+
+    def get_page_content_ids(self, entries):
+        """
+        Get the IDs the requested page is served from, read off the feed entries.
+        Returns None when the page reaches past the materialized window.
+        """
+        if self.is_cursor_mode():
+            position = self.paginator.decode_cursor(self.request)
+            size = self.paginator.get_page_size(self.request)
+            now = timezone.now().timestamp()
+            following = [
+                (content_id, published_at) for content_id, published_at in entries if published_at <= now
+            ]
+            if position is not None:
+                value, key = position
+                value = value.timestamp()
+                # Same keyset order as the paginator: (-published_at, -id)
+                following = [
+                    (content_id, published_at) for content_id, published_at in following
+                    if published_at < value or (published_at == value and uuid.UUID(content_id) < key)
+                ]
+            # A page that uses up the rest of a full window may continue past it
+            if len(following) <= size and is_feed_window_full(entries):
+                return None
+            return [content_id for content_id, _ in following[:size]]
+
+        limit = int(self.request.query_params.get('limit', 20))
+        offset = int(self.request.query_params.get('offset', 0))
+        visible_ids = get_visible_feed_ids(entries)
+        if offset + limit > len(visible_ids) and is_feed_window_full(entries):
+            return None
+        return visible_ids[offset:offset + limit]
     
     def get_queryset(self):
         """Get content filtered for current user."""
         content_type = self.request.query_params.get('content_type', 'MOTIVATION')
+
+        if self.is_cursor_mode():
+            return Content.get_audience_queryset(
+                content_type=content_type,
+                grade=self.request.user.grade,
+                school=self.request.user.school,
+            ).filter(published_at__lte=timezone.now()).with_authors()
+
         limit = int(self.request.query_params.get('limit', 20))
         offset = int(self.request.query_params.get('offset', 0))
 
-        return Content.get_content_for_user(
+        return get_feed_page(
             user=self.request.user,
             content_type=content_type,
             limit=limit,
@@ -38,7 +119,7 @@ class ContentListView(generics.ListAPIView):
         return context
 
 
-class ContentDetailView(generics.RetrieveAPIView):
+class ContentDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     Retrieve specific content item.
     """
@@ -47,9 +128,20 @@ class ContentDetailView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
 
+    def get_etag(self, request):
+        """
+        ETag from the feed version, which moves on every content write, the
+        user's bookmarks and the item's engagement.
+        """
+        content_id = self.kwargs['id']
+        return make_etag(
+            'content', content_id, request.user.pk, get_feed_version(),
+            get_version_stamp(f"bookmarks:{request.user.pk}"), *get_engagement_stamps([content_id]),
+        )
+
     def get_queryset(self):
         """Allow access to any approved and active content."""
-        return Content.objects.filter(is_active=True, approval_status='approved')
+        return Content.objects.filter(is_active=True, approval_status='approved').with_authors()
     
     def get_serializer_context(self):
         """Add request context to serializer."""
@@ -58,33 +150,47 @@ class ContentDetailView(generics.RetrieveAPIView):
         return context
 
 
+class ContentSearchView(generics.ListAPIView):
+    """
+    Full-text search over the content visible to the current user.
+    Takes `q` and an optional `content_type`; results are ranked by relevance.
+    """
+    serializer_class = ContentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Get matching content filtered by the same rules as the feed."""
+        queryset = Content.get_audience_queryset(
+            content_type=self.request.query_params.get('content_type') or None,
+            grade=self.request.user.grade,
+            school=self.request.user.school,
+        ).filter(published_at__lte=timezone.now()).with_authors()
+        return search_content(queryset, self.request.query_params.get('q', ''))
+
+
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])  # Allow unauthenticated access
 def get_daily_quote(request):
     """
     Get today's motivational quote.
+    Served from a per-day cache with ETag/Last-Modified for cheap revalidation.
     """
-    today = timezone.now().date()
+    payload = get_daily_quote_payload()
+    if payload is None:
+        return Response({'message': 'No quote available'}, status=status.HTTP_404_NOT_FOUND)
 
-    # Try to get a quote for today, fallback to latest
-    quote = Content.objects.filter(
-        content_type='QUOTATION',
-        is_active=True,
-        published_at__date=today
-    ).first()
+    data = dict(payload['data'])
+    etag = payload['etag']
+    if request.user.is_authenticated:
+        data['is_bookmarked'] = Bookmark.objects.filter(user=request.user, content_id=data['id']).exists()
+        etag = f"{etag}-{int(data['is_bookmarked'])}"
+    etag = make_etag(etag)
 
-    if not quote:
-        # Fallback to latest quote
-        quote = Content.objects.filter(
-            content_type='QUOTATION',
-            is_active=True
-        ).order_by('-published_at').first()
+    not_modified = get_not_modified_response(request, etag, payload['last_modified'])
+    if not_modified is not None:
+        return not_modified
 
-    if quote:
-        serializer = ContentSerializer(quote, context={'request': request})
-        return Response(serializer.data)
-
-    return Response({'message': 'No quote available'}, status=status.HTTP_404_NOT_FOUND)
+    return set_conditional_headers(Response(data), request, etag, payload['last_modified'])
 
 
 @api_view(['POST'])
@@ -92,34 +198,36 @@ def get_daily_quote(request):
 def toggle_bookmark(request, content_id):
     """
     Toggle bookmark for content.
+    Returns the new state and the content's bookmark count.
     """
-    try:
-        content = Content.objects.get(id=content_id, is_active=True)
-    except Content.DoesNotExist:
+    result = toggle_bookmark_for_user(request.user, content_id)
+    if result is None:
         return Response({'error': 'Content not found'}, status=status.HTTP_404_NOT_FOUND)
-    
-    bookmark, created = Bookmark.objects.get_or_create(
-        user=request.user,
-        content=content
-    )
-    
-    if not created:
-        bookmark.delete()
-        return Response({'bookmarked': False})
-    
-    return Response({'bookmarked': True})
+
+    bookmarked, bookmark_count = result
+    return Response({'bookmarked': bookmarked, 'bookmark_count': bookmark_count})
 
 
-class BookmarkListView(generics.ListAPIView):
+class BookmarkListView(ConditionalGetMixin, CursorPaginationMixin, generics.ListAPIView):
     """
     List user's bookmarked content.
     """
     serializer_class = BookmarkSerializer
+    cursor_ordering = ('-created_at', '-id')
     permission_classes = [permissions.IsAuthenticated]
+
+    def get_etag(self, request):
+        """ETag from the user's bookmarks, the feed version and the engagement of the bookmarked items."""
+        return make_etag(
+            'bookmarks', request.user.pk, get_version_stamp(f"bookmarks:{request.user.pk}"), get_feed_version(),
+            *get_engagement_stamps(get_bookmarked_content_ids(request.user)), request.get_full_path(),
+        )
     
     def get_queryset(self):
         """Get user's bookmarks."""
-        return Bookmark.objects.filter(user=self.request.user).order_by('-created_at')
+        return Bookmark.objects.filter(user=self.request.user).select_related(
+            'content', 'content__created_by', 'content__submitted_by'
+        ).order_by('-created_at')
 
 
 # Admin views
@@ -153,14 +261,90 @@ class AdminContentDeleteView(generics.DestroyAPIView):
     permission_classes = [permissions.IsAuthenticated, IsAdminOrReadOnly]
 
 
+def _parse_date_boundary(name, value, end=False):
+    """
+    Parse a date or datetime query parameter into an aware datetime.
+    A plain date as the end of a range covers that whole day.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValidationError({name: 'Enter a date (YYYY-MM-DD) or ISO 8601 datetime.'})
+        moment = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
 class AdminContentListView(generics.ListAPIView):
     """
     List all content for admin.
+
+    Filters: status, content_type, grade, source,
+    published_after and published_before. Pass view=summary for the
+    lightweight listing without body and rich_content.
     """
-    queryset = Content.objects.all()
+    queryset = Content.objects.with_authors()
     serializer_class = ContentSerializer
+    pagination_class = CachedCountPagination
     permission_classes = [permissions.IsAuthenticated, IsAdminOrReadOnly]
-    
+    excerpt_length = 200
+
+    def is_summary_mode(self):
+        return self.request.query_params.get('view') == 'summary'
+
+    def get_queryset(self):
+        """Apply the admin filters, deferring large text columns in summary mode."""
+        params = self.request.query_params
+        queryset = super().get_queryset()
+
+        approval_status = params.get('status')
+        if approval_status:
+            if approval_status not in dict(Content.APPROVAL_STATUS_CHOICES):
+                raise ValidationError({'status': f'Unknown status: {approval_status}'})
+            queryset = queryset.filter(approval_status=approval_status)
+
+        content_type = params.get('content_type')
+        if content_type:
+            if content_type not in dict(Content.CONTENT_TYPE_CHOICES):
+                raise ValidationError({'content_type': f'Unknown content type: {content_type}'})
+            queryset = queryset.filter(content_type=content_type)
+
+        grade = params.get('grade')
+        if grade:
+            try:
+                queryset = queryset.filter(target_grade=int(grade))
+            except ValueError:
+                raise ValidationError({'grade': 'Grade must be a number.'})
+
+        source = params.get('source')
+        if source:
+            if source not in dict(Content.SOURCE_CHOICES):
+                raise ValidationError({'source': f'Unknown source: {source}'})
+            queryset = queryset.filter(source=source)
+
+        if params.get('published_after'):
+            queryset = queryset.filter(
+                published_at__gte=_parse_date_boundary('published_after', params['published_after'])
+            )
+        if params.get('published_before'):
+            queryset = queryset.filter(
+                published_at__lt=_parse_date_boundary('published_before', params['published_before'], end=True)
+            )
+
+        if self.is_summary_mode():
+            queryset = queryset.summarized(self.excerpt_length)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.is_summary_mode():
+            return ContentSummarySerializer
+        return super().get_serializer_class()
+
     def get_serializer_context(self):
         """Add request context to serializer."""
         context = super().get_serializer_context()
@@ -169,22 +353,34 @@ class AdminContentListView(generics.ListAPIView):
 
 
 
-class CommentListCreateView(generics.ListCreateAPIView):
+class CommentListCreateView(ConditionalGetMixin, CursorPaginationMixin, generics.ListCreateAPIView):
     """
     List and create comments for a specific content.
     """
     serializer_class = CommentSerializer
+    cursor_ordering = ('-created_at', '-id')
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_etag(self, request):
+        """ETag from the content's comment version."""
+        content_id = self.kwargs['content_id']
+        return make_etag(
+            'comments', content_id, get_version_stamp(f"comments:{content_id}"), request.get_full_path(),
+        )
+
+    def get_last_modified(self, request):
+        return get_version_stamp(f"comments:{self.kwargs['content_id']}")
+
     def get_queryset(self):
         """Get comments for the specific content."""
         content_id = self.kwargs['content_id']
-        return Comment.objects.filter(content_id=content_id, is_active=True)
+        return Comment.objects.filter(content_id=content_id, is_active=True).with_user()
 
     def perform_create(self, serializer):
         """Set the user and content when creating a comment."""
         content_id = self.kwargs['content_id']
-        serializer.save(user=self.request.user, content_id=content_id)
+        with transaction.atomic():
+            serializer.save(user=self.request.user, content_id=content_id)
 
 
 class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -200,4 +396,10 @@ class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def perform_update(self, serializer):
         """Ensure user can only update their own comments."""
-        serializer.save(user=self.request.user)
+        with transaction.atomic():
+            serializer.save(user=self.request.user)
+
+    def perform_destroy(self, instance):
+        """Delete the comment and its counter update together."""
+        with transaction.atomic():
+            instance.delete()
@@ -5,3 +5,12 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
     verbose_name = 'Core'
+
+    def ready(self):
+        from django.core.signals import request_started
+        from django.db.backends.signals import connection_created
+        from .db import configure_sqlite_connection, count_connection_opened, count_connections_reused
+
+        connection_created.connect(configure_sqlite_connection, dispatch_uid='core.configure_sqlite_connection')
+        connection_created.connect(count_connection_opened, dispatch_uid='core.count_connection_opened')
+        request_started.connect(count_connections_reused, dispatch_uid='core.count_connections_reused')
@@ -0,0 +1,124 @@
+"""
+Project cache layer on top of Django's cache.
+
+Keys are namespaced and versioned: make_key('feed', ...) embeds the
+namespace's current version, and bump_namespace('feed') invalidates every
+key in it at once without scanning. get_or_set() protects expensive
+recomputation from stampedes: a cold miss is computed by one caller while
+the others wait for its result, and warm entries are refreshed slightly
+before they expire with probability rising towards expiry (XFetch), so
+popular keys never expire under load.
+"""
+import logging
+import math
+import random
+import time
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+logger = logging.getLogger(__name__)
+
+NAMESPACE_KEY_PREFIX = 'ns'
+LOCK_KEY_PREFIX = 'lock'
+
+
+def is_shared_cache(alias='default'):
+    """
+    Whether a cache is shared between processes (web and Celery workers).
+    False for per-process backends and while Redis is down and the fallback
+    local-memory cache is serving.
+    """
+    backend = caches[alias]
+    if isinstance(backend, (LocMemCache, DummyCache)):
+        return False
+    return not getattr(backend, 'using_fallback', False)
+
+
+def _namespace_key(namespace):
+    return f"{NAMESPACE_KEY_PREFIX}:{namespace}"
+
+
+def get_namespace_version(namespace):
+    """Get the current version of a namespace, initialising it if needed."""
+    key = _namespace_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Missing (cold cache or evicted): start past any old generation whose entries may still be live
+        initial = time.time_ns()
+        cache.add(key, initial, None)
+        version = cache.get(key, initial)
+    return version
+
+
+def bump_namespace(namespace):
+    """Invalidate every key in a namespace by moving to a new version."""
+    key = _namespace_key(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Version key missing (cold cache or evicted): jump past any old generation
+        cache.set(key, time.time_ns(), None)
+
+
+def make_key(namespace, *parts):
+    """Build a versioned cache key within a namespace."""
+    suffix = ':'.join(str(part) for part in parts)
+    return f"{namespace}:v{get_namespace_version(namespace)}:{suffix}"
+
+
+def _compute_and_store(key, compute, timeout):
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+    if callable(timeout):
+        timeout = timeout(value)
+    cache.set(key, (value, delta, time.time() + timeout), timeout)
+    return value
+
+
+def get_or_set(key, compute, timeout, beta=None, lock_timeout=None):
+    """
+    Get a cached value, computing and storing it with stampede protection.
+
+    compute() is called with no arguments; None is a valid cached result.
+    timeout may be a callable taking the computed value and returning seconds.
+    beta > 1 refreshes earlier, beta < 1 later (see CACHE_EARLY_REFRESH_BETA).
+    """
+    beta = getattr(settings, 'CACHE_EARLY_REFRESH_BETA', 1.0) if beta is None else beta
+    lock_timeout = lock_timeout or getattr(settings, 'CACHE_LOCK_TIMEOUT', 10)
+    lock_key = f"{LOCK_KEY_PREFIX}:{key}"
+
+    entry = cache.get(key)
+    if entry is not None:
+        value, delta, expires_at = entry
+        # XFetch: -log(u) is usually small, so early refreshes cluster just before expiry
+        if time.time() - delta * beta * math.log(1.0 - random.random()) < expires_at:
+            return value
+        # One caller refreshes early; everyone else keeps serving the current value
+        if not cache.add(lock_key, True, lock_timeout):
+            return value
+        try:
+            return _compute_and_store(key, compute, timeout)
+        finally:
+            cache.delete(lock_key)
+
+    if cache.add(lock_key, True, lock_timeout):
+        try:
+            return _compute_and_store(key, compute, timeout)
+        finally:
+            cache.delete(lock_key)
+
+    # Another caller is computing: wait for its result rather than piling on
+    deadline = time.monotonic() + lock_timeout
+    poll = 0.01
+    while time.monotonic() < deadline:
+        time.sleep(poll)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+        poll = min(poll * 2, 0.2)
+
+    logger.warning(f"Timed out waiting for cache key {key}; computing it directly")
+    return _compute_and_store(key, compute, timeout)
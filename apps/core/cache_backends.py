@@ -0,0 +1,73 @@
+"""
+Cache backends for the project.
+"""
+import logging
+import time
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackRedisCache(RedisCache):
+    """
+    Redis cache that degrades to a per-process local-memory cache while
+    Redis is unreachable, retrying Redis every FALLBACK_RETRY_INTERVAL seconds.
+    Cached data is then per-worker until Redis returns, but requests keep working.
+    """
+
+    def __init__(self, server, params):
+        super().__init__(server, params)
+        self._options = dict(self._options)
+        self._retry_interval = self._options.pop('FALLBACK_RETRY_INTERVAL', 30)
+        fallback_params = {key: value for key, value in params.items() if key != 'OPTIONS'}
+        self._fallback = LocMemCache(f'fallback:{server}', fallback_params)
+        self._redis_down_until = 0.0
+
+    @property
+    def using_fallback(self):
+        """Whether calls currently go to the local-memory fallback."""
+        return time.monotonic() < self._redis_down_until
+
+    def _call(self, name, *args, **kwargs):
+        if not self.using_fallback:
+            try:
+                return getattr(super(), name)(*args, **kwargs)
+            except (RedisConnectionError, RedisTimeoutError) as e:
+                logger.warning(f"Redis cache unavailable, using local memory for {self._retry_interval}s: {e}")
+                self._redis_down_until = time.monotonic() + self._retry_interval
+        return getattr(self._fallback, name)(*args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        return self._call('add', *args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        return self._call('get', *args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        return self._call('set', *args, **kwargs)
+
+    def touch(self, *args, **kwargs):
+        return self._call('touch', *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._call('delete', *args, **kwargs)
+
+    def get_many(self, *args, **kwargs):
+        return self._call('get_many', *args, **kwargs)
+
+    def has_key(self, *args, **kwargs):
+        return self._call('has_key', *args, **kwargs)
+
+    def incr(self, *args, **kwargs):
+        return self._call('incr', *args, **kwargs)
+
+    def set_many(self, *args, **kwargs):
+        return self._call('set_many', *args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        return self._call('delete_many', *args, **kwargs)
+
+    def clear(self):
+        return self._call('clear')
@@ -0,0 +1,158 @@
+"""
+Database connection tuning and accounting.
+
+Every new SQLite connection gets WAL journaling, a relaxed fsync policy,
+a busy timeout and larger page/mmap caches, so concurrent gunicorn workers
+can read while one writes, and writers wait for the lock instead of failing
+with "database is locked".
+
+Each worker process also counts the connections it opens and the requests
+that reuse a persistent connection (CONN_MAX_AGE), reported by /health/.
+explain_table_scans() backs the check_query_plans command.
+"""
+import functools
+import logging
+import os
+import random
+import re
+import threading
+import time
+from django.conf import settings
+from django.db import OperationalError, connection, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_stats_lock = threading.Lock()
+_connection_stats = {}
+
+
+def get_sqlite_pragmas():
+    """Get the PRAGMA statements configured in settings, skipping empty values."""
+    # busy_timeout goes first so switching the journal mode waits for other connections
+    values = [
+        ('busy_timeout', getattr(settings, 'SQLITE_BUSY_TIMEOUT', 5000)),
+        ('journal_mode', getattr(settings, 'SQLITE_JOURNAL_MODE', 'WAL')),
+        ('synchronous', getattr(settings, 'SQLITE_SYNCHRONOUS', 'NORMAL')),
+        ('mmap_size', getattr(settings, 'SQLITE_MMAP_SIZE', 128 * 1024 * 1024)),
+        ('cache_size', getattr(settings, 'SQLITE_CACHE_SIZE', -20000)),
+    ]
+    return [f"PRAGMA {name} = {value}" for name, value in values if value not in (None, '')]
+
+
+def apply_sqlite_pragmas(cursor, pragmas=None):
+    """Run PRAGMA statements on a DB-API cursor."""
+    for statement in get_sqlite_pragmas() if pragmas is None else pragmas:
+        cursor.execute(statement)
+
+
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """connection_created handler that tunes SQLite connections."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        apply_sqlite_pragmas(cursor)
+    logger.debug(f"Applied SQLite pragmas to connection {connection.alias}")
+
+
+def retry_on_database_lock(func=None, *, attempts=None, delay=0.01):
+    """
+    Retry a transactional function when SQLite reports a locked database.
+    busy_timeout covers most waits, but a read transaction that must upgrade
+    to a write after another writer committed fails at once, as do shared-cache
+    table locks. Inside an outer atomic block the error is re-raised instead.
+    """
+    def decorator(inner):
+        @functools.wraps(inner)
+        def wrapper(*args, **kwargs):
+            tries = attempts or getattr(settings, 'SQLITE_LOCK_RETRIES', 5)
+            for attempt in range(tries):
+                try:
+                    return inner(*args, **kwargs)
+                except OperationalError as e:
+                    if 'locked' not in str(e) or connection.in_atomic_block or attempt == tries - 1:
+                        raise
+                    time.sleep(min(delay * (2 ** attempt), 0.25) * (0.5 + random.random()))
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+def _bump_connection_stat(alias, name):
+    with _stats_lock:
+        stats = _connection_stats.setdefault(alias, {'opened': 0, 'reused': 0})
+        stats[name] += 1
+
+
+def count_connection_opened(sender, connection, **kwargs):
+    """connection_created handler counting new connections per alias."""
+    _bump_connection_stat(connection.alias, 'opened')
+
+
+def count_connections_reused(sender, **kwargs):
+    """
+    request_started handler counting requests that start on an open connection.
+    Runs after Django's close_old_connections, so only connections kept
+    alive by CONN_MAX_AGE are counted.
+    """
+    for conn in connections.all(initialized_only=True):
+        if conn.connection is not None:
+            _bump_connection_stat(conn.alias, 'reused')
+
+
+def get_connection_stats():
+    """Get this worker's connection counters and settings per database alias."""
+    with _stats_lock:
+        counters = {alias: dict(stats) for alias, stats in _connection_stats.items()}
+    return {
+        'pid': os.getpid(),
+        'databases': {
+            alias: {
+                **counters.get(alias, {'opened': 0, 'reused': 0}),
+                'conn_max_age': conn_settings.get('CONN_MAX_AGE'),
+                'health_checks': conn_settings.get('CONN_HEALTH_CHECKS'),
+            }
+            for alias, conn_settings in settings.DATABASES.items()
+        },
+    }
+
+
+def reset_connection_stats():
+    """Clear this process's connection counters."""
+    with _stats_lock:
+        _connection_stats.clear()
+
+
+# Forked workers start counting from zero
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_connection_stats)
+
+
+_SQLITE_TABLE_SCAN = re.compile(r'\bSCAN (?!CONSTANT ROW|SUBQUERY)(\w+)(?: AS \w+)?$')
+_POSTGRES_TABLE_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+
+def explain_table_scans(queryset):
+    """
+    EXPLAIN a queryset and find the tables it reads with a full table scan.
+    On PostgreSQL sequential scans are disabled while planning, so a Seq Scan
+    left in the plan means no index can serve the query.
+    Returns (plan, tables); raises NotImplementedError on other backends.
+    """
+    conn = connections[queryset.db]
+    if conn.vendor == 'postgresql':
+        with transaction.atomic(using=queryset.db):
+            with conn.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        return plan, sorted(set(_POSTGRES_TABLE_SCAN.findall(plan)))
+
+    if conn.vendor == 'sqlite':
+        plan = queryset.explain()
+        tables = set()
+        for line in plan.splitlines():
+            match = _SQLITE_TABLE_SCAN.search(line.strip())
+            if match:
+                tables.add(match.group(1))
+        return plan, sorted(tables)
+
+    raise NotImplementedError(f"Query plan checks are not supported on {conn.vendor}")
@@ -0,0 +1,110 @@
+"""
+Primary/replica database routing.
+
+Reads for the content and users apps go to a read replica while a safe
+(GET/HEAD/OPTIONS) request is being served. Everything else - writes,
+unsafe requests, Celery tasks, management commands and auth/session
+tables - uses the primary. After a client makes a successful write it is
+pinned to the primary for REPLICA_PIN_SECONDS so it reads its own writes.
+Login and signup requests carry no credential yet, so those views pin the
+token they issue with pin_credential_to_primary().
+"""
+import hashlib
+import random
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PIN_KEY_PREFIX = 'db:pin'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def get_replica_aliases():
+    """Get the configured replica database aliases."""
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def replica_reads_allowed():
+    """Whether reads in the current context may use a replica."""
+    return _replica_reads.get()
+
+
+def set_replica_reads(allowed):
+    """Allow or forbid replica reads in the current context; returns a reset token."""
+    return _replica_reads.set(allowed)
+
+
+def reset_replica_reads(token):
+    """Restore the routing state saved by set_replica_reads()."""
+    _replica_reads.reset(token)
+
+
+def get_credential_key(credential):
+    """Build the client key for a bearer token or session cookie value."""
+    return hashlib.sha256(credential.encode('utf-8')).hexdigest()
+
+
+def get_client_key(request):
+    """
+    Identify the client from its bearer token or session cookie.
+    The same token sent either way gives the same key.
+    Returns None for anonymous clients, which are never pinned.
+    """
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    auth_type, _, token = auth_header.partition(' ')
+    if auth_type.lower() == 'bearer' and token:
+        credential = token
+    else:
+        credential = auth_header or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if not credential:
+        return None
+    return get_credential_key(credential)
+
+
+def get_pin_key(client_key):
+    """Build the cache key pinning a client to the primary."""
+    return f"{PIN_KEY_PREFIX}:{client_key}"
+
+
+def pin_to_primary(client_key):
+    """Send the client's reads to the primary for REPLICA_PIN_SECONDS."""
+    cache.set(get_pin_key(client_key), True, getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+
+
+def pin_credential_to_primary(credential):
+    """Pin a newly issued token, so the client's first requests find its user on the primary."""
+    if get_replica_aliases():
+        pin_to_primary(get_credential_key(credential))
+
+
+def is_pinned_to_primary(client_key):
+    """Whether the client wrote recently and must read from the primary."""
+    return bool(cache.get(get_pin_key(client_key)))
+
+
+class PrimaryReplicaRouter:
+    """Route replica-eligible reads to a random replica, everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        replicas = get_replica_aliases()
+        if not replicas or not replica_reads_allowed():
+            return 'default'
+        if model._meta.app_label not in getattr(settings, 'REPLICA_READ_APPS', ('content', 'users')):
+            return 'default'
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas mirror the primary, so objects may relate across them
+        databases = {'default', *get_replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive schema changes through replication
+        return db == 'default'
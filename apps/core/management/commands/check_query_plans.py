@@ -0,0 +1,68 @@
+"""
+Management command to EXPLAIN the hot endpoint queries and fail on table scans.
+"""
+import uuid
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from apps.content.models import Content, Bookmark, Comment
+from apps.core.db import explain_table_scans
+from apps.users.models import User
+
+
+def get_hot_queries(using='default'):
+    """Build the querysets behind the busiest endpoints, with sample parameters."""
+    user = User(grade=7, school='Sample School')
+    start = timezone.now()
+    end = start + timedelta(days=1)
+    sample_id = uuid.uuid4()
+    content = Content.objects.using(using)
+    return [
+        ('content feed page', Content.get_content_for_user(user, 'MOTIVATION').using(using)),
+        ('materialized feed', Content.get_audience_queryset(
+            content_type='MOTIVATION', grade=user.grade, school=user.school,
+        ).using(using).order_by('-published_at', '-id').values_list('id', 'published_at')[:500]),
+        ('daily quote', content.filter(
+            content_type='QUOTATION', is_active=True, published_at__gte=start, published_at__lt=end,
+        ).with_authors()[:1]),
+        ('daily quote fallback', content.filter(
+            content_type='QUOTATION', is_active=True,
+        ).with_authors().order_by('-published_at')[:1]),
+        ('pending review queue', content.filter(approval_status='pending').with_authors().order_by('-created_at')),
+        ('my submissions', content.filter(submitted_by_id=sample_id).with_authors().order_by('-created_at', '-id')),
+        ('content detail', content.filter(pk=sample_id, is_active=True, approval_status='approved').with_authors()),
+        ('bookmark list', Bookmark.objects.using(using).filter(user_id=sample_id).select_related(
+            'content').order_by('-created_at')),
+        ('comment list', Comment.objects.using(using).filter(content_id=sample_id, is_active=True).with_user()),
+    ]
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN the hot endpoint queries and fail if any falls back to a full table scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias to check',
+        )
+
+    def handle(self, *args, **options):
+        failures = []
+        for name, queryset in get_hot_queries(options['database']):
+            try:
+                plan, tables = explain_table_scans(queryset)
+            except NotImplementedError as e:
+                raise CommandError(str(e))
+
+            if tables:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"  {name}: table scan on {', '.join(tables)}"))
+            else:
+                self.stdout.write(f"  {name}: ok")
+            if options['verbosity'] > 1:
+                self.stdout.write(plan)
+
+        if failures:
+            raise CommandError(f"Table scans in: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS('All hot queries use indexes'))
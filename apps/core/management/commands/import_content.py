@@ -0,0 +1,102 @@
+"""
+Management command to bulk-import curated content from a JSON or CSV file.
+"""
+import csv
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from apps.content.ingestion import ingest_content, INGEST_BATCH_SIZE
+from apps.content.models import Content
+
+VALID_CONTENT_TYPES = {choice for choice, _ in Content.CONTENT_TYPE_CHOICES}
+
+
+class Command(BaseCommand):
+    help = 'Bulk-import content items from a JSON array or CSV file, skipping duplicates'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to a .json or .csv file')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=INGEST_BATCH_SIZE,
+            help='Rows per hash lookup and insert batch',
+        )
+        parser.add_argument(
+            '--source',
+            default='admin',
+            help='Source recorded for items that do not set one',
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'File not found: {path}')
+
+        rows = self._read_rows(path)
+        self.stdout.write(f'Importing {len(rows)} items from {path}...')
+
+        items = []
+        for number, row in enumerate(rows, start=1):
+            try:
+                items.append(self._build_content(row, options['source']))
+            except ValueError as e:
+                self.stdout.write(self.style.WARNING(f'  Skipping row {number}: {e}'))
+
+        result = ingest_content(items, batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Import completed. Created: {result['created']}, duplicates skipped: {result['duplicates']}"
+            )
+        )
+
+    def _read_rows(self, path):
+        """Read rows from a JSON array or CSV file."""
+        if path.suffix.lower() == '.json':
+            with path.open(encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, list):
+                raise CommandError('JSON file must contain an array of items')
+            return data
+        if path.suffix.lower() == '.csv':
+            with path.open(encoding='utf-8', newline='') as f:
+                return list(csv.DictReader(f))
+        raise CommandError('Unsupported file type; use .json or .csv')
+
+    def _build_content(self, row, default_source):
+        """Build an unsaved Content instance from a row."""
+        body = (row.get('body') or '').strip()
+        if not body:
+            raise ValueError('body is required')
+
+        content_type = row.get('content_type') or 'MOTIVATION'
+        if content_type not in VALID_CONTENT_TYPES:
+            raise ValueError(f'invalid content_type {content_type}')
+
+        target_grade = row.get('target_grade') or None
+        if target_grade is not None:
+            target_grade = int(target_grade)
+            if target_grade < 1 or target_grade > 12:
+                raise ValueError('target_grade must be between 1 and 12')
+
+        published_at = timezone.now()
+        if row.get('published_at'):
+            published_at = parse_datetime(row['published_at'])
+            if published_at is None:
+                raise ValueError(f"invalid published_at {row['published_at']}")
+            if timezone.is_naive(published_at):
+                published_at = timezone.make_aware(published_at)
+
+        return Content(
+            content_type=content_type,
+            title=(row.get('title') or '').strip() or None,
+            body=body,
+            youtube_url=row.get('youtube_url') or None,
+            news_url=row.get('news_url') or None,
+            target_grade=target_grade,
+            target_school=(row.get('target_school') or '').strip() or None,
+            source=row.get('source') or default_source,
+            published_at=published_at,
+        )
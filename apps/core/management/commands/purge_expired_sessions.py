@@ -0,0 +1,26 @@
+"""
+Management command to purge expired sessions and stale OAuth tokens.
+"""
+from django.core.management.base import BaseCommand
+from apps.core.services import AuthCleanupService
+
+
+class Command(BaseCommand):
+    help = 'Delete expired sessions and stale OAuth tokens in bounded chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Number of rows deleted per transaction',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Purging expired sessions and OAuth tokens...')
+        summary = AuthCleanupService(chunk_size=options['chunk_size']).run()
+
+        self.stdout.write(f"  sessions removed: {summary['sessions']}")
+        self.stdout.write(f"  oauth tokens removed: {summary['oauth_tokens']}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Cleanup completed in {summary['duration_seconds']}s")
+        )
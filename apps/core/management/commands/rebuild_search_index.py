@@ -0,0 +1,35 @@
+"""
+Management command to rebuild the content full-text search index.
+"""
+from django.core.management.base import BaseCommand
+from django.db import connections
+from apps.content.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the content search index, optionally after a VACUUM that renumbers SQLite rowids'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Database alias to rebuild',
+        )
+        parser.add_argument(
+            '--vacuum',
+            action='store_true',
+            help='VACUUM the database first, then rebuild the index it invalidates',
+        )
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if options['vacuum']:
+            self.stdout.write('Vacuuming database...')
+            with connections[using].cursor() as cursor:
+                cursor.execute('VACUUM')
+
+        self.stdout.write('Rebuilding search index...')
+        if rebuild_search_index(using):
+            self.stdout.write(self.style.SUCCESS('Search index rebuilt.'))
+        else:
+            self.stdout.write(f"No search index on the {connections[using].vendor} backend; nothing to rebuild.")
@@ -0,0 +1,24 @@
+"""
+Management command to recompute denormalized content engagement counters.
+"""
+from django.core.management.base import BaseCommand
+from apps.content.counters import reconcile_counters, RECONCILE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recompute bookmark and comment counters on Content from the source tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=RECONCILE_BATCH_SIZE,
+            help='Content rows checked per UPDATE',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Reconciling content counters...')
+        result = reconcile_counters(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciliation completed. Checked: {result['checked']}, fixed: {result['fixed']}")
+        )
@@ -0,0 +1,31 @@
+"""
+Management command to run a local stub of the OpenAI API.
+"""
+from django.core.management.base import BaseCommand
+from apps.core.openai_stub import StubOpenAIServer
+
+
+class Command(BaseCommand):
+    help = 'Run a local OpenAI stub server for offline generation and throughput tests'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Host to bind')
+        parser.add_argument('--port', type=int, default=8765, help='Port to bind')
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.0,
+            help='Simulated API latency per request in seconds',
+        )
+
+    def handle(self, *args, **options):
+        server = StubOpenAIServer(options['host'], options['port'], options['latency'])
+        self.stdout.write(
+            self.style.SUCCESS(f'OpenAI stub listening; set OPENAI_BASE_URL={server.base_url}')
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -3,6 +3,7 @@ Management command to seed initial data.
 """
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from apps.content.ingestion import ingest_content
 from apps.content.models import Content
 from django.utils import timezone
 
@@ -47,27 +48,27 @@ class Command(BaseCommand):
         # Create sample content
         sample_content = [
             {
-                'section': 'NEWS',
+                'content_type': 'MOTIVATION',
                 'title': 'Young Scientists Win Regional Competition',
                 'body': 'Students from grades 6-8 showcased amazing science projects at the regional fair. Their innovative solutions to environmental challenges impressed judges and inspired their peers!',
                 'target_grade': 7,
                 'source': 'admin'
             },
             {
-                'section': 'JOKES',
+                'content_type': 'JOKES',
                 'title': None,
                 'body': 'Why did the math book look so sad? Because it had too many problems!',
                 'target_grade': 5,
                 'source': 'admin'
             },
             {
-                'section': 'QUOTATION',
+                'content_type': 'QUOTATION',
                 'title': 'Quote by Albert Einstein',
                 'body': 'The important thing is not to stop questioning. Curiosity has its own reason for existing.',
                 'source': 'admin'
             },
             {
-                'section': 'STORY',
+                'content_type': 'MOTIVATION',
                 'title': 'The Kindness Chain',
                 'body': 'When Sarah helped her classmate with homework, it started a chain reaction. Soon, everyone was helping each other, and their classroom became the most supportive place in the school!',
                 'target_grade': 4,
@@ -75,18 +76,18 @@ class Command(BaseCommand):
             }
         ]
         
-        created_count = 0
-        for item in sample_content:
-            if not Content.objects.filter(body=item['body']).exists():
-                Content.objects.create(
-                    section=item['section'],
-                    title=item['title'],
-                    body=item['body'],
-                    target_grade=item.get('target_grade'),
-                    source=item['source'],
-                    published_at=timezone.now()
-                )
-                created_count += 1
+        # Existing items are skipped by hash
+        created_count = ingest_content([
+            Content(
+                content_type=item['content_type'],
+                title=item['title'],
+                body=item['body'],
+                target_grade=item.get('target_grade'),
+                source=item['source'],
+                published_at=timezone.now()
+            )
+            for item in sample_content
+        ])['created']
         
         if created_count > 0:
             self.stdout.write(f'Created {created_count} sample content items')
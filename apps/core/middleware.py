@@ -0,0 +1,35 @@
+"""
+Middleware for core app.
+"""
+from .db_router import (
+    SAFE_METHODS, get_client_key, get_replica_aliases, is_pinned_to_primary, pin_to_primary,
+    reset_replica_reads, set_replica_reads,
+)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Allow replica reads for safe requests from clients that have not written
+    recently, and pin clients to the primary after a successful write.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not get_replica_aliases():
+            return self.get_response(request)
+
+        client_key = get_client_key(request)
+        safe = request.method in SAFE_METHODS
+        allowed = safe and not (client_key and is_pinned_to_primary(client_key))
+
+        token = set_replica_reads(allowed)
+        try:
+            response = self.get_response(request)
+        finally:
+            reset_replica_reads(token)
+
+        if not safe and client_key and response.status_code < 400:
+            pin_to_primary(client_key)
+        return response
@@ -0,0 +1,99 @@
+"""
+Offline stand-ins for the OpenAI chat completions API.
+
+Use get_stub_transport() to plug a canned-response transport straight into
+build_openai_client(), or run StubOpenAIServer (see the run_openai_stub
+command) and point OPENAI_BASE_URL at it to exercise the real HTTP path.
+"""
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import httpx
+
+
+def build_stub_completion(payload):
+    """
+    Build a chat completion response body for a request payload.
+    Quote prompts get a quote object; other prompts get a list of blurbs.
+    """
+    messages = payload.get('messages') or [{}]
+    prompt = messages[-1].get('content', '')
+    if 'quote' in prompt.lower():
+        content = json.dumps({'body': 'Every day is a chance to learn something new.', 'source': 'Unknown'})
+    else:
+        content = json.dumps([
+            {'title': f'Stub story {uuid.uuid4().hex[:8]}', 'body': 'Students worked together to plant a school garden.',
+             'category': 'kindness', 'ageRange': 'stub'}
+        ])
+    return {
+        'id': f'chatcmpl-{uuid.uuid4().hex}',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': payload.get('model', 'stub'),
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': content},
+            'finish_reason': 'stop',
+        }],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+    }
+
+
+def get_stub_transport(latency: float = 0.0) -> httpx.MockTransport:
+    """
+    Get an httpx transport that answers chat completions without the network.
+    """
+    def handler(request):
+        if latency:
+            time.sleep(latency)
+        return httpx.Response(200, json=build_stub_completion(json.loads(request.content or b'{}')))
+
+    return httpx.MockTransport(handler)
+
+
+class StubOpenAIRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler serving canned chat completions on any POST path.
+    """
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so client connection pooling is exercised
+    latency = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        if self.latency:
+            time.sleep(self.latency)
+
+        body = json.dumps(build_stub_completion(payload)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubOpenAIServer(ThreadingHTTPServer):
+    """
+    Local HTTP server standing in for the OpenAI API.
+    """
+    daemon_threads = True
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0):
+        handler = type('Handler', (StubOpenAIRequestHandler,), {'latency': latency})
+        super().__init__((host, port), handler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/v1'
+
+    def start_in_thread(self) -> threading.Thread:
+        """Serve requests from a background thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
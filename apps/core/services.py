@@ -4,14 +4,79 @@ Core services for OpenAI integration and content generation.
 import json
 import logging
 import hashlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
+import httpx
+import openai
+from openai import OpenAI
 from django.conf import settings
+from django.contrib.sessions.models import Session
 from django.utils import timezone
+from apps.content.ingestion import ingest_content
 from apps.content.models import Content
 from apps.users.models import User
 
 logger = logging.getLogger(__name__)
 
+_openai_client = None
+_openai_client_key = None
+_openai_client_lock = threading.Lock()
+
+
+def build_openai_client(api_key: str, transport: httpx.BaseTransport = None) -> OpenAI:
+    """
+    Build an OpenAI client with a keep-alive connection pool and timeouts from settings.
+    Retries are handled by OpenAIService._create_completion, so the client does not retry.
+    """
+    http_client = httpx.Client(
+        transport=transport,
+        timeout=httpx.Timeout(
+            getattr(settings, 'OPENAI_TIMEOUT', 30.0),
+            connect=getattr(settings, 'OPENAI_CONNECT_TIMEOUT', 5.0),
+        ),
+        limits=httpx.Limits(
+            max_connections=getattr(settings, 'OPENAI_MAX_CONNECTIONS', 20),
+            max_keepalive_connections=getattr(settings, 'OPENAI_MAX_KEEPALIVE_CONNECTIONS', 10),
+        ),
+    )
+    return OpenAI(
+        api_key=api_key,
+        base_url=getattr(settings, 'OPENAI_BASE_URL', None) or None,
+        max_retries=0,
+        http_client=http_client,
+    )
+
+
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+    """
+    global _openai_client, _openai_client_key
+    if _openai_client is None or _openai_client_key != api_key:
+        with _openai_client_lock:
+            if _openai_client is None or _openai_client_key != api_key:
+                _openai_client = build_openai_client(api_key)
+                _openai_client_key = api_key
+    return _openai_client
+
+
+def reset_openai_client():
+    """
+    Drop the process-wide OpenAI client (e.g. in a forked worker).
+    """
+    global _openai_client, _openai_client_key
+    _openai_client = None
+    _openai_client_key = None
+
+
+# Forked workers must not share the parent's pooled sockets
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_openai_client)
+
 
 class OpenAIService:
     """
@@ -22,6 +87,30 @@ class OpenAIService:
         self.api_key = settings.OPENAI_API_KEY
         if not self.api_key:
             logger.warning("OpenAI API key not configured")
+
+    def _create_completion(self, client, **kwargs):
+        """
+        Create a chat completion, backing off and retrying when rate limited.
+        Honours the Retry-After header when the API sends one.
+        """
+        max_retries = getattr(settings, 'OPENAI_MAX_RETRIES', 3)
+        base_delay = getattr(settings, 'OPENAI_RETRY_BASE_DELAY', 1.0)
+        for attempt in range(max_retries + 1):
+            try:
+                return client.chat.completions.create(**kwargs)
+            except (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError) as e:
+                if attempt == max_retries:
+                    raise
+                delay = base_delay * (2 ** attempt) + random.uniform(0, base_delay)
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                logger.warning(f"OpenAI request failed ({e.__class__.__name__}), retrying in {delay:.1f}s")
+                time.sleep(delay)
     
     def generate_motivational_content(self, grade: int, count: int = 3) -> List[Dict[str, Any]]:
         """
@@ -32,8 +121,7 @@ class OpenAIService:
             return []
         
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.api_key)
+            client = get_openai_client(self.api_key)
             
             system_prompt = (
                 "You are a cheerful editor writing short motivational news blurbs for school students. "
@@ -50,7 +138,8 @@ class OpenAIService:
                 "Avoid real private data and violent content."
             )
             
-            response = client.chat.completions.create(
+            response = self._create_completion(
+                client,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -88,8 +177,7 @@ class OpenAIService:
             return {}
         
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.api_key)
+            client = get_openai_client(self.api_key)
             
             system_prompt = (
                 "You are a wise mentor creating inspirational quotes for students. "
@@ -102,7 +190,8 @@ class OpenAIService:
                 "Keep the quote under 100 characters and make it inspiring for young learners."
             )
             
-            response = client.chat.completions.create(
+            response = self._create_completion(
+                client,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -144,41 +233,39 @@ class ContentGenerationService:
         
         # Generate content from OpenAI
         content_items = self.openai_service.generate_motivational_content(grade, count)
-        
-        created_count = 0
+        return self._store_grade_content(grade, content_items)
+
+    def _store_grade_content(self, grade: int, content_items: List[Dict[str, Any]]) -> int:
+        """
+        Store generated content items for a grade.
+        Returns number of items created.
+        """
+        items = []
         for item in content_items:
-            try:
-                # Sanitize and validate content
-                title = self._sanitize_text(item.get('title', ''))
-                body = self._sanitize_text(item.get('body', ''))
-                
-                if not body:
-                    logger.warning(f"Empty body for grade {grade} item: {item}")
-                    continue
-                
-                # Check for duplicates using hash
-                content_hash = self._generate_hash(title, body)
-                if Content.objects.filter(hash=content_hash).exists():
-                    logger.info(f"Duplicate content found for grade {grade}, skipping")
-                    continue
-                
-                # Create content record
-                content = Content.objects.create(
-                    section='NEWS',
-                    title=title if title else None,
-                    body=body,
-                    target_grade=grade,
-                    source='openai',
-                    published_at=timezone.now(),
-                    hash=content_hash
-                )
-                
-                created_count += 1
-                logger.info(f"Created content for grade {grade}: {content.id}")
-                
-            except Exception as e:
-                logger.error(f"Error creating content for grade {grade}: {e}")
+            # Sanitize and validate content
+            title = self._sanitize_text(item.get('title', ''))
+            body = self._sanitize_text(item.get('body', ''))
+            
+            if not body:
+                logger.warning(f"Empty body for grade {grade} item: {item}")
                 continue
+            
+            items.append(Content(
+                content_type='MOTIVATION',
+                title=title if title else None,
+                body=body,
+                target_grade=grade,
+                source='openai',
+                published_at=timezone.now(),
+                hash=self._generate_hash(title, body)
+            ))
+        
+        try:
+            # Duplicates are skipped by hash in one lookup
+            created_count = ingest_content(items)['created']
+        except Exception as e:
+            logger.error(f"Error creating content for grade {grade}: {e}")
+            return 0
         
         logger.info(f"Created {created_count} content items for grade {grade}")
         return created_count
@@ -191,6 +278,13 @@ class ContentGenerationService:
         logger.info("Generating daily quote")
         
         quote_data = self.openai_service.generate_daily_quote()
+        return self._store_daily_quote(quote_data)
+
+    def _store_daily_quote(self, quote_data: Dict[str, Any]) -> bool:
+        """
+        Store a generated daily quote.
+        Returns True if quote was created.
+        """
         if not quote_data:
             logger.error("Failed to generate quote")
             return False
@@ -203,21 +297,18 @@ class ContentGenerationService:
                 logger.error("Empty quote body")
                 return False
             
-            # Check for duplicates
-            content_hash = self._generate_hash('', body)
-            if Content.objects.filter(hash=content_hash).exists():
-                logger.info("Duplicate quote found, skipping")
-                return False
-            
-            # Create quote record
-            content = Content.objects.create(
-                section='QUOTATION',
+            # Create quote record, skipping duplicates by hash
+            content = Content(
+                content_type='QUOTATION',
                 title=f"Quote by {source}",
                 body=body,
                 source='openai',
                 published_at=timezone.now(),
-                hash=content_hash
+                hash=self._generate_hash('', body)
             )
+            if not ingest_content([content])['created']:
+                logger.info("Duplicate quote found, skipping")
+                return False
             
             logger.info(f"Created daily quote: {content.id}")
             return True
@@ -226,23 +317,45 @@ class ContentGenerationService:
             logger.error(f"Error creating daily quote: {e}")
             return False
     
-    def generate_content_for_all_grades(self) -> Dict[str, int]:
+    def generate_content_for_all_grades(self, count: int = 3) -> Dict[str, int]:
         """
         Generate content for all grades (1-12).
+        OpenAI requests for every grade and the quote run concurrently,
+        capped at CONTENT_GENERATION_CONCURRENCY; results are stored as they arrive.
         Returns summary of created items.
         """
-        logger.info("Starting content generation for all grades")
+        concurrency = max(1, getattr(settings, 'CONTENT_GENERATION_CONCURRENCY', 13))
+        logger.info(f"Starting content generation for all grades (concurrency {concurrency})")
         
         summary = {}
         total_created = 0
         
-        for grade in range(1, 13):
-            created_count = self.generate_content_for_grade(grade)
-            summary[f'grade_{grade}'] = created_count
-            total_created += created_count
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='content-generation') as executor:
+            quote_future = executor.submit(self.openai_service.generate_daily_quote)
+            grade_futures = {
+                grade: executor.submit(self.openai_service.generate_motivational_content, grade, count)
+                for grade in range(1, 13)
+            }
+            
+            # Database writes stay on the calling thread
+            for grade, future in grade_futures.items():
+                try:
+                    content_items = future.result()
+                except Exception as e:
+                    logger.error(f"Content generation for grade {grade} failed: {e}")
+                    content_items = []
+                created_count = self._store_grade_content(grade, content_items)
+                summary[f'grade_{grade}'] = created_count
+                total_created += created_count
+            
+            # Generate daily quote
+            try:
+                quote_data = quote_future.result()
+            except Exception as e:
+                logger.error(f"Daily quote generation failed: {e}")
+                quote_data = {}
+            quote_created = self._store_daily_quote(quote_data)
         
-        # Generate daily quote
-        quote_created = self.generate_daily_quote()
         summary['daily_quote'] = 1 if quote_created else 0
         total_created += summary['daily_quote']
         
@@ -275,3 +388,62 @@ class ContentGenerationService:
         """
         content = (title or '') + (body or '')
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class AuthCleanupService:
+    """
+    Service for purging expired sessions and stale OAuth tokens.
+    Rows are deleted in bounded chunks, each in its own short transaction,
+    so the tables are never locked for long.
+    """
+
+    def __init__(self, chunk_size: int = None):
+        self.chunk_size = chunk_size or getattr(settings, 'AUTH_CLEANUP_CHUNK_SIZE', 1000)
+
+    def purge_expired_sessions(self) -> int:
+        """
+        Delete expired sessions.
+        Returns number of rows removed.
+        """
+        return self._delete_in_chunks(Session.objects.filter(expire_date__lt=timezone.now()))
+
+    def purge_expired_oauth_tokens(self) -> int:
+        """
+        Delete expired OAuth access tokens (without refresh tokens) and grants.
+        Returns number of rows removed.
+        """
+        from oauth2_provider.models import get_access_token_model, get_grant_model
+
+        now = timezone.now()
+        access_tokens = get_access_token_model().objects.filter(refresh_token__isnull=True, expires__lt=now)
+        grants = get_grant_model().objects.filter(expires__lt=now)
+        return self._delete_in_chunks(access_tokens) + self._delete_in_chunks(grants)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Purge all expired authentication data.
+        Returns summary of rows removed and time taken.
+        """
+        start = time.monotonic()
+        summary = {
+            'sessions': self.purge_expired_sessions(),
+            'oauth_tokens': self.purge_expired_oauth_tokens(),
+        }
+        summary['duration_seconds'] = round(time.monotonic() - start, 3)
+
+        logger.info(f"Auth cleanup complete: {summary}")
+        return summary
+
+    def _delete_in_chunks(self, queryset) -> int:
+        """
+        Delete rows matching a queryset one primary-key chunk at a time.
+        """
+        deleted_total = 0
+        model = queryset.model
+        while True:
+            pks = list(queryset.values_list('pk', flat=True)[:self.chunk_size])
+            if not pks:
+                return deleted_total
+            # Each chunk is its own short delete transaction
+            model.objects.filter(pk__in=pks).delete()
+            deleted_total += len(pks)
@@ -3,7 +3,8 @@ Celery tasks for content generation and scheduling.
 """
 from celery import shared_task
 from django.utils import timezone
-from .services import ContentGenerationService
+from apps.users.visits import flush_pending_visits
+from .services import ContentGenerationService, AuthCleanupService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -90,3 +91,51 @@ def generate_daily_quote():
             'error': str(e),
             'timestamp': timezone.now().isoformat()
         }
+
+
+@shared_task
+def purge_expired_auth_data():
+    """
+    Periodic task to purge expired sessions and stale OAuth tokens.
+    """
+    logger.info("Starting expired auth data cleanup")
+    
+    try:
+        summary = AuthCleanupService().run()
+        
+        return {
+            'status': 'success',
+            'summary': summary,
+            'timestamp': timezone.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Expired auth data cleanup failed: {e}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'timestamp': timezone.now().isoformat()
+        }
+
+
+@shared_task
+def flush_visit_tracking():
+    """
+    Periodic task to write queued visit events to users and visits.
+    """
+    try:
+        summary = flush_pending_visits()
+
+        return {
+            'status': 'success',
+            'summary': summary,
+            'timestamp': timezone.now().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Visit tracking flush failed: {e}")
+        return {
+            'status': 'error',
+            'error': str(e),
+            'timestamp': timezone.now().isoformat()
+        }
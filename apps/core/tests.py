@@ -1,11 +1,14 @@
 """
 Tests for core app.
 """
-from django.test import TestCase
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
+from unittest import skipUnless
 from unittest.mock import patch, MagicMock
 import json
 
@@ -178,3 +181,533 @@ class OpenAIServiceTest(TestCase):
         
         result = self.service.generate_daily_quote()
         self.assertEqual(result, {})
+
+
+class AuthCleanupServiceTest(TestCase):
+    """Test expired session and token cleanup."""
+
+    def setUp(self):
+        from django.contrib.sessions.models import Session
+        from django.utils import timezone
+        now = timezone.now()
+        for i in range(5):
+            Session.objects.create(
+                session_key=f'expired{i:025d}',
+                session_data='',
+                expire_date=now - timezone.timedelta(hours=1)
+            )
+        Session.objects.create(
+            session_key='fresh' + '0' * 27,
+            session_data='',
+            expire_date=now + timezone.timedelta(hours=1)
+        )
+
+    def test_purge_expired_sessions_in_chunks(self):
+        """Test that only expired sessions are removed, across several chunks."""
+        from django.contrib.sessions.models import Session
+        from apps.core.services import AuthCleanupService
+
+        summary = AuthCleanupService(chunk_size=2).run()
+
+        self.assertEqual(summary['sessions'], 5)
+        self.assertEqual(summary['oauth_tokens'], 0)
+        self.assertIn('duration_seconds', summary)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['fresh' + '0' * 27])
+
+    def test_purge_task(self):
+        """Test the periodic cleanup task."""
+        from apps.core.tasks import purge_expired_auth_data
+
+        result = purge_expired_auth_data()
+
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['summary']['sessions'], 5)
+
+
+class ContentGenerationConcurrencyTest(TestCase):
+    """Test concurrent generation across grades."""
+
+    def test_grades_generated_concurrently(self):
+        """Test that the all-grades run takes about one round-trip, not thirteen."""
+        import time
+        from apps.core.services import ContentGenerationService
+
+        def slow_content(grade, count=3):
+            time.sleep(0.2)
+            return [{'title': f'Grade {grade}', 'body': f'Keep going, grade {grade}!'}]
+
+        def slow_quote():
+            time.sleep(0.2)
+            return {'body': 'Learning never exhausts the mind.', 'source': 'Leonardo da Vinci'}
+
+        service = ContentGenerationService()
+        with patch.object(service.openai_service, 'generate_motivational_content', side_effect=slow_content), \
+                patch.object(service.openai_service, 'generate_daily_quote', side_effect=slow_quote), \
+                self.settings(CONTENT_GENERATION_CONCURRENCY=13):
+            start = time.monotonic()
+            summary = service.generate_content_for_all_grades()
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(summary['daily_quote'], 1)
+        self.assertEqual(sum(summary[f'grade_{grade}'] for grade in range(1, 13)), 12)
+
+    def test_failed_grade_does_not_stop_batch(self):
+        """Test that one failing grade is reported as zero and others still run."""
+        from apps.core.services import ContentGenerationService
+
+        def flaky_content(grade, count=3):
+            if grade == 5:
+                raise RuntimeError('boom')
+            return [{'title': f'Grade {grade}', 'body': f'Well done, grade {grade}!'}]
+
+        service = ContentGenerationService()
+        with patch.object(service.openai_service, 'generate_motivational_content', side_effect=flaky_content), \
+                patch.object(service.openai_service, 'generate_daily_quote', return_value={}):
+            summary = service.generate_content_for_all_grades()
+
+        self.assertEqual(summary['grade_5'], 0)
+        self.assertEqual(summary['grade_6'], 1)
+        self.assertEqual(summary['daily_quote'], 0)
+
+    def test_rate_limit_backoff(self):
+        """Test that rate-limited completions are retried after Retry-After."""
+        import httpx
+        import openai
+        from apps.core.services import OpenAIService
+
+        response = httpx.Response(429, headers={'retry-after': '0'}, request=httpx.Request('POST', 'http://test'))
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [
+            openai.RateLimitError('slow down', response=response, body=None),
+            'completion',
+        ]
+
+        with self.settings(OPENAI_RETRY_BASE_DELAY=0), patch('apps.core.services.time.sleep') as mock_sleep:
+            result = OpenAIService()._create_completion(client, model='test')
+
+        self.assertEqual(result, 'completion')
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+        mock_sleep.assert_called_once()
+
+
+class PooledOpenAIClientTest(TestCase):
+    """Test the process-wide pooled OpenAI client against offline stubs."""
+
+    def setUp(self):
+        from apps.core import services
+        services.reset_openai_client()
+        self.addCleanup(services.reset_openai_client)
+
+    def test_client_reused_across_calls(self):
+        """Test that the client is built once per process."""
+        from apps.core.services import get_openai_client
+
+        self.assertIs(get_openai_client('test-key'), get_openai_client('test-key'))
+
+    def test_generation_through_stub_transport(self):
+        """Test many generations share one client via the stub transport."""
+        from apps.core import services
+        from apps.core.openai_stub import get_stub_transport
+
+        with self.settings(OPENAI_API_KEY='test-key'):
+            client = services.build_openai_client('test-key', transport=get_stub_transport())
+            with patch('apps.core.services.build_openai_client', return_value=client) as mock_build:
+                service = services.OpenAIService()
+                results = [service.generate_motivational_content(grade) for grade in range(1, 13) for _ in range(5)]
+
+        mock_build.assert_called_once()
+        self.assertEqual(len(results), 60)
+        self.assertTrue(all(len(items) == 1 for items in results))
+
+    def test_generation_through_stub_server(self):
+        """Test the real HTTP path against the local stub server."""
+        from apps.core.openai_stub import StubOpenAIServer
+        from apps.core.services import OpenAIService
+
+        server = StubOpenAIServer()
+        server.start_in_thread()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with self.settings(OPENAI_API_KEY='test-key', OPENAI_BASE_URL=server.base_url):
+            quote = OpenAIService().generate_daily_quote()
+
+        self.assertEqual(quote['source'], 'Unknown')
+
+
+class ImportContentCommandTest(TestCase):
+    """Test the bulk content import command."""
+
+    def test_import_json_skips_duplicates_and_invalid_rows(self):
+        """Test importing a JSON file twice creates each item once."""
+        import os
+        import tempfile
+        from io import StringIO
+        from django.core.management import call_command
+        from apps.content.models import Content
+
+        rows = [
+            {'content_type': 'JOKES', 'title': 'Joke', 'body': 'Why was the math book sad?'},
+            {'content_type': 'MOTIVATION', 'body': 'Keep going!', 'target_grade': 4},
+            {'content_type': 'UNKNOWN', 'body': 'Bad type'},
+            {'content_type': 'MOTIVATION', 'body': ''},
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump(rows, f)
+        self.addCleanup(os.remove, f.name)
+
+        out = StringIO()
+        call_command('import_content', f.name, stdout=out)
+        call_command('import_content', f.name, stdout=out)
+
+        self.assertEqual(Content.objects.count(), 2)
+        self.assertEqual(Content.objects.get(content_type='MOTIVATION').target_grade, 4)
+        self.assertIn('Created: 0, duplicates skipped: 2', out.getvalue())
+
+
+class SQLitePragmaTest(TestCase):
+    """Test the SQLite connection tuning hook."""
+
+    def test_pragmas_follow_settings(self):
+        from apps.core.db import get_sqlite_pragmas
+
+        with self.settings(SQLITE_BUSY_TIMEOUT=1234, SQLITE_MMAP_SIZE=''):
+            pragmas = get_sqlite_pragmas()
+        self.assertEqual(pragmas[0], 'PRAGMA busy_timeout = 1234')
+        self.assertFalse(any('mmap_size' in pragma for pragma in pragmas))
+
+    def test_pragmas_applied_to_new_connections(self):
+        import tempfile
+        from django.db import connections
+
+        with tempfile.NamedTemporaryFile(suffix='.sqlite3') as db_file:
+            conn = connections['default'].__class__(
+                {**connections['default'].settings_dict, 'NAME': db_file.name}, alias='pragma-test'
+            )
+            try:
+                conn.ensure_connection()
+                with conn.cursor() as cursor:
+                    cursor.execute('PRAGMA journal_mode')
+                    self.assertEqual(cursor.fetchone()[0].lower(), 'wal')
+                    cursor.execute('PRAGMA synchronous')
+                    self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+                    cursor.execute('PRAGMA busy_timeout')
+                    self.assertEqual(cursor.fetchone()[0], 5000)
+            finally:
+                conn.close()
+
+
+@override_settings(DATABASE_REPLICAS=['replica_0'])
+class ReplicaRoutingTest(TestCase):
+    """Test primary/replica routing and read-your-writes pinning."""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from apps.core.db_router import PrimaryReplicaRouter
+
+        cache.clear()
+        self.router = PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+
+    def route_during(self, request, model):
+        """Run a request through the middleware and record the read alias for a model."""
+        from apps.core.middleware import ReplicaRoutingMiddleware
+
+        seen = {}
+
+        def view(req):
+            seen['alias'] = self.router.db_for_read(model)
+            return HttpResponse(status=201 if req.method == 'POST' else 200)
+
+        ReplicaRoutingMiddleware(view)(request)
+        return seen['alias']
+
+    def test_reads_outside_requests_use_primary(self):
+        from apps.content.models import Content
+
+        self.assertEqual(self.router.db_for_read(Content), 'default')
+        self.assertEqual(self.router.db_for_write(Content), 'default')
+        self.assertFalse(self.router.allow_migrate('replica_0', 'content'))
+
+    def test_safe_requests_read_from_replica(self):
+        from django.contrib.sessions.models import Session
+        from apps.content.models import Content
+
+        request = self.factory.get('/api/content/', HTTP_AUTHORIZATION='Bearer session-abc')
+        self.assertEqual(self.route_during(request, Content), 'replica_0')
+        # Auth and session tables stay on the primary
+        request = self.factory.get('/api/content/', HTTP_AUTHORIZATION='Bearer session-abc')
+        self.assertEqual(self.route_during(request, Session), 'default')
+        request = self.factory.post('/api/content/', HTTP_AUTHORIZATION='Bearer session-xyz')
+        self.assertEqual(self.route_during(request, Content), 'default')
+
+    def test_client_pinned_to_primary_after_write(self):
+        from apps.content.models import Content
+
+        auth = {'HTTP_AUTHORIZATION': 'Bearer session-abc'}
+        self.route_during(self.factory.post('/api/content/1/bookmark/', **auth), Content)
+
+        self.assertEqual(self.route_during(self.factory.get('/api/content/', **auth), Content), 'default')
+        other = self.factory.get('/api/content/', HTTP_AUTHORIZATION='Bearer session-other')
+        self.assertEqual(self.route_during(other, Content), 'replica_0')
+
+    def test_signup_pins_issued_token_to_primary(self):
+        from django.urls import reverse
+        from apps.users.models import User
+
+        response = self.client.post(reverse('users:signup'), {
+            'email': 'pinned@example.com', 'password': 'Testpass123!', 'first_name': 'Pin', 'grade': 7,
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        token = response.json()['access_token']
+
+        # The first authenticated GET loads the new user, which a lagging replica may not have yet
+        request = self.factory.get('/api/users/me/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertEqual(self.route_during(request, User), 'default')
+        request = self.factory.get('/api/users/me/')
+        request.COOKIES['sessionid'] = token
+        self.assertEqual(self.route_during(request, User), 'default')
+        request = self.factory.get('/api/users/me/', HTTP_AUTHORIZATION='Bearer session-other')
+        self.assertEqual(self.route_during(request, User), 'replica_0')
+
+
+class ConnectionStatsTest(TestCase):
+    """Test per-worker connection counters on the health endpoint."""
+
+    def setUp(self):
+        from apps.core.db import reset_connection_stats
+
+        reset_connection_stats()
+
+    def test_new_connection_counted_as_opened(self):
+        from django.db import connections
+        from apps.core.db import get_connection_stats
+
+        conn = connections.create_connection('default')
+        try:
+            conn.ensure_connection()
+        finally:
+            conn.close()
+        self.assertEqual(get_connection_stats()['databases']['default']['opened'], 1)
+
+    def test_health_reports_reused_connections(self):
+        response = self.client.get(reverse('health-check'))
+        first = response.json()['database_connections']['databases']['default']
+
+        response = self.client.get(reverse('health-check'))
+        second = response.json()['database_connections']['databases']['default']
+        self.assertEqual(second['reused'], first['reused'] + 1)
+        self.assertIn('conn_max_age', second)
+
+
+class QueryPlanCheckTest(TestCase):
+    """Test the hot-query EXPLAIN check against the migrated schema."""
+
+    def test_hot_queries_use_indexes(self):
+        from io import StringIO
+        from django.core.management import call_command
+
+        out = StringIO()
+        call_command('check_query_plans', stdout=out)
+        self.assertIn('pending review queue: ok', out.getvalue())
+
+    def test_table_scan_detected(self):
+        from apps.content.models import Content
+        from apps.core.db import explain_table_scans
+
+        _, tables = explain_table_scans(Content.objects.filter(body='unindexed'))
+        self.assertEqual(tables, ['content'])
+
+    def test_feed_uses_partial_index(self):
+        from apps.content.models import Content
+        from apps.core.db import explain_table_scans
+
+        plan, tables = explain_table_scans(
+            Content.objects.filter(is_active=True, approval_status='approved', content_type='JOKES')
+        )
+        self.assertEqual(tables, [])
+        self.assertIn('content_feed_idx', plan)
+
+
+class CacheLayerTest(TestCase):
+    """Test namespaced keys and stampede protection in apps.core.cache."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+
+    def test_bump_namespace_changes_keys(self):
+        from apps.core.cache import bump_namespace, make_key
+
+        key = make_key('things', 'a', 1)
+        self.assertEqual(make_key('things', 'a', 1), key)
+        bump_namespace('things')
+        self.assertNotEqual(make_key('things', 'a', 1), key)
+        self.assertEqual(make_key('others', 'a', 1), make_key('others', 'a', 1))
+
+    def test_bump_namespace_with_evicted_version(self):
+        from django.core.cache import cache
+        from apps.core.cache import bump_namespace, make_key
+
+        key = make_key('things', 'a')
+        cache.delete('ns:things')
+        bump_namespace('things')
+        self.assertNotEqual(make_key('things', 'a'), key)
+
+    def test_evicted_version_does_not_revive_old_keys(self):
+        from django.core.cache import cache
+        from apps.core.cache import bump_namespace, make_key
+
+        first = make_key('things', 'a')
+        bump_namespace('things')
+        second = make_key('things', 'a')
+        cache.delete('ns:things')
+        self.assertNotIn(make_key('things', 'a'), (first, second))
+
+    def test_local_memory_cache_not_shared(self):
+        from apps.core.cache import is_shared_cache
+
+        self.assertFalse(is_shared_cache())
+
+    def test_get_or_set_computes_once(self):
+        from apps.core.cache import get_or_set
+
+        compute = MagicMock(return_value=None)
+        self.assertIsNone(get_or_set('answer', compute, 60))
+        self.assertIsNone(get_or_set('answer', compute, 60))
+        self.assertEqual(compute.call_count, 1)
+
+    def test_concurrent_misses_compute_once(self):
+        import threading
+        import time
+        from apps.core.cache import get_or_set
+
+        calls = []
+
+        def slow_compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return 42
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_set('slow', slow_compute, 60)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [42] * 8)
+
+    def test_entry_refreshed_before_expiry(self):
+        import time
+        from apps.core.cache import get_or_set
+
+        def slow_old():
+            time.sleep(0.05)
+            return 'old'
+
+        # A 0.05s recompute with an unlucky draw refreshes ~0.7s before expiry
+        get_or_set('early', slow_old, 60)
+        with patch('apps.core.cache.time.time', return_value=time.time() + 59.5), \
+                patch('apps.core.cache.random.random', return_value=0.999999):
+            self.assertEqual(get_or_set('early', lambda: 'new', 60), 'new')
+        self.assertEqual(get_or_set('early', lambda: 'newer', 60), 'new')
+
+    def test_refresh_in_progress_serves_current_value(self):
+        from django.core.cache import cache
+        from apps.core.cache import LOCK_KEY_PREFIX, get_or_set
+
+        get_or_set('busy', lambda: 'old', 60)
+        cache.add(f'{LOCK_KEY_PREFIX}:busy', True, 10)
+        with patch('apps.core.cache.random.random', return_value=0.999999):
+            self.assertEqual(get_or_set('busy', lambda: 'new', 60, beta=10 ** 9), 'old')
+
+
+class FallbackRedisCacheTest(TestCase):
+    """Test the Redis cache backend's local-memory fallback."""
+
+    def test_unreachable_redis_uses_local_memory(self):
+        from apps.core.cache_backends import FallbackRedisCache
+
+        backend = FallbackRedisCache('redis://127.0.0.1:1/0', {
+            'OPTIONS': {'socket_connect_timeout': 0.1, 'FALLBACK_RETRY_INTERVAL': 60},
+        })
+        backend.set('key', 'value', 30)
+        self.assertTrue(backend.using_fallback)
+        self.assertEqual(backend.get('key'), 'value')
+        self.assertTrue(backend.add('counter', 1))
+        self.assertEqual(backend.incr('counter'), 2)
+
+    def test_health_reports_cache_backend(self):
+        response = self.client.get(reverse('health-check'))
+        self.assertEqual(response.json()['cache']['using_fallback'], False)
+
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+
+@skipUnless(fakeredis, 'fakeredis is not installed')
+class RedisCacheLayerTest(TestCase):
+    """Test the cache layer against a Redis stand-in shared like a real server."""
+
+    def setUp(self):
+        from apps.core.cache_backends import FallbackRedisCache
+
+        server = fakeredis.FakeServer()
+
+        def make_backend():
+            return FallbackRedisCache('redis://fake:6379/0', {
+                'KEY_PREFIX': 'test',
+                'OPTIONS': {'connection_class': fakeredis.FakeConnection, 'server': server},
+            })
+
+        self.web_cache = make_backend()
+        self.worker_cache = make_backend()
+
+    def test_namespace_shared_between_clients(self):
+        from apps.core.cache import bump_namespace, make_key
+
+        with patch('apps.core.cache.cache', self.web_cache):
+            key = make_key('feed', 'MOTIVATION')
+            self.web_cache.set(key, ['a'], 60)
+        with patch('apps.core.cache.cache', self.worker_cache):
+            self.assertEqual(self.worker_cache.get(make_key('feed', 'MOTIVATION')), ['a'])
+            bump_namespace('feed')
+        with patch('apps.core.cache.cache', self.web_cache):
+            self.assertNotEqual(make_key('feed', 'MOTIVATION'), key)
+        self.assertFalse(self.web_cache.using_fallback)
+
+    def test_quote_generated_in_worker_reaches_web(self):
+        from apps.content.daily_quote import get_daily_quote_payload
+        from apps.content.models import Content
+
+        Content.objects.create(
+            content_type='QUOTATION', body='Yesterday.', source='admin',
+            published_at=timezone.now() - timezone.timedelta(days=1),
+        )
+        with patch('apps.core.cache.cache', self.web_cache):
+            self.assertEqual(get_daily_quote_payload()['data']['body'], 'Yesterday.')
+        # generate_daily_quote runs in Celery, which invalidates through its own client
+        with patch('apps.core.cache.cache', self.worker_cache):
+            Content.objects.create(content_type='QUOTATION', body='Today.', source='openai')
+        with patch('apps.core.cache.cache', self.web_cache):
+            self.assertEqual(get_daily_quote_payload()['data']['body'], 'Today.')
+
+    def test_get_or_set_through_redis(self):
+        from apps.core.cache import get_or_set
+
+        compute = MagicMock(return_value={'n': 1})
+        with patch('apps.core.cache.cache', self.web_cache):
+            self.assertEqual(get_or_set('shared', compute, 60), {'n': 1})
+        with patch('apps.core.cache.cache', self.worker_cache):
+            self.assertEqual(get_or_set('shared', compute, 60), {'n': 1})
+        self.assertEqual(compute.call_count, 1)
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from django.contrib.auth import get_user_model
 from django.http import JsonResponse
 from django.shortcuts import render
+from .db import get_connection_stats
 from .tasks import generate_daily_content, generate_content_for_grade, generate_daily_quote
 
 User = get_user_model()
@@ -53,6 +54,13 @@ def health_check(request):
             health_status['services']['redis'] = 'unhealthy: cache not working'
     except Exception as e:
         health_status['services']['redis'] = f'unhealthy: {str(e)}'
+    health_status['cache'] = {
+        'backend': type(cache).__name__,
+        'using_fallback': getattr(cache, 'using_fallback', False),
+    }
+
+    # Per-worker connection counters, to confirm persistent connections are reused
+    health_status['database_connections'] = get_connection_stats()
 
     # For health checks, we mainly care that Django is responding
     # Database and Redis issues won't make the service unhealthy during startup
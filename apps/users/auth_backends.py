@@ -1,19 +1,75 @@
 """
 Custom authentication backends for the application.
 """
-from django.contrib.sessions.models import Session
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework import authentication, exceptions
 from .models import User
+from .token_store import resolve_token
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+MAX_CACHED_TOKENS_PER_USER = 20
+
+
+def get_session_key_from_token(token):
+    """Get the session key from a Bearer token ("session-{key}" or a bare key)."""
+    if token.startswith('session-'):
+        return token[8:]  # Remove 'session-' prefix
+    return token  # Use directly as session key
+
+
+def get_token_cache_key(session_key):
+    """Build the cache key for an authenticated token."""
+    digest = hashlib.sha256(session_key.encode('utf-8')).hexdigest()
+    return f"auth:token:{digest}"
+
+
+def get_user_tokens_cache_key(user_id):
+    """Build the cache key indexing a user's cached tokens."""
+    return f"auth:user:{user_id}"
+
+
+def cache_authenticated_user(session_key, user, expire_date):
+    """Cache a token's user until the cache TTL or session expiry, whichever is first."""
+    timeout = getattr(settings, 'AUTH_TOKEN_CACHE_TIMEOUT', 60)
+    if expire_date:
+        timeout = min(timeout, int((expire_date - timezone.now()).total_seconds()))
+    if timeout <= 0:
+        return
+
+    token_key = get_token_cache_key(session_key)
+    cache.set(token_key, user, timeout)
+
+    # Index the token under its user so deactivation can drop it
+    index_key = get_user_tokens_cache_key(user.pk)
+    token_keys = cache.get(index_key) or []
+    if token_key not in token_keys:
+        token_keys = (token_keys + [token_key])[-MAX_CACHED_TOKENS_PER_USER:]
+    cache.set(index_key, token_keys, timeout)
+
+
+def invalidate_cached_token(token):
+    """Drop a token from the authentication cache (e.g. on logout)."""
+    cache.delete(get_token_cache_key(get_session_key_from_token(token)))
+
+
+def invalidate_user_tokens(user_id):
+    """Drop every cached token of a user (e.g. on deactivation or profile change)."""
+    index_key = get_user_tokens_cache_key(user_id)
+    token_keys = cache.get(index_key) or []
+    cache.delete_many(token_keys + [index_key])
+
 
 class SessionTokenAuthentication(authentication.BaseAuthentication):
     """
     Custom authentication backend for session-based tokens.
-    Validates tokens in the format: "session-{uuid}"
+    Validates tokens in the format: "session-{uuid}" against the configured
+    Bearer token backend (see apps.users.token_store).
+    Authenticated tokens are cached briefly so warm requests skip the database.
     """
 
     def authenticate(self, request):
@@ -33,40 +89,27 @@ class SessionTokenAuthentication(authentication.BaseAuthentication):
                 return None
 
             # Handle both formats: "session-{uuid}" and direct session keys
-            if token.startswith('session-'):
-                session_uuid = token[8:]  # Remove 'session-' prefix
-            else:
-                session_uuid = token  # Use directly as session key
-
-            # Find the session with this key
-            try:
-                session = Session.objects.get(session_key=session_uuid)
-
-                # Check if session is not expired
-                if session.expire_date and session.expire_date < timezone.now():
-                    logger.warning(f"Session expired: {session_uuid}")
-                    return None
-
-                # Get user data from session
-                user_id = session.get_decoded().get('user_id')
-                user_email = session.get_decoded().get('user_email')
+            session_uuid = get_session_key_from_token(token)
 
-                if not user_id or not user_email:
-                    logger.warning(f"Invalid session data: {session_uuid}")
-                    return None
+            cached_user = cache.get(get_token_cache_key(session_uuid))
+            if cached_user is not None:
+                return (cached_user, None)
 
-                # Get the user
-                try:
-                    user = User.objects.get(id=user_id, email=user_email, is_active=True)
-                    logger.info(f"✅ Authenticated user via session token: {user.email}")
-                    return (user, None)
+            # Resolve the token through the configured token backend
+            token_data = resolve_token(session_uuid)
+            if token_data is None:
+                logger.warning(f"Session not found or expired: {session_uuid}")
+                return None
 
-                except User.DoesNotExist:
-                    logger.warning(f"User not found in session: {user_email}")
-                    return None
+            # Get the user
+            try:
+                user = User.objects.get(id=token_data.user_id, email=token_data.user_email, is_active=True)
+                logger.info(f"✅ Authenticated user via session token: {user.email}")
+                cache_authenticated_user(session_uuid, user, token_data.expire_date)
+                return (user, None)
 
-            except Session.DoesNotExist:
-                logger.warning(f"Session not found: {session_uuid}")
+            except User.DoesNotExist:
+                logger.warning(f"User not found in session: {token_data.user_email}")
                 return None
 
         except ValueError:
@@ -82,15 +125,18 @@ class SessionOrTokenAuthentication(authentication.BaseAuthentication):
     Authentication that tries both session tokens and Django sessions.
     Falls back to session authentication if token auth fails.
     """
+    # Both backends are stateless, so they are shared across requests
+    token_authentication = SessionTokenAuthentication()
+    session_authentication = authentication.SessionAuthentication()
 
     def authenticate(self, request):
         """
         Try session token authentication first, then fall back to session auth.
         """
         # Try custom session token auth first
-        auth_result = SessionTokenAuthentication().authenticate(request)
+        auth_result = self.token_authentication.authenticate(request)
         if auth_result:
             return auth_result
 
         # Fall back to Django's session authentication
-        return authentication.SessionAuthentication().authenticate(request)
+        return self.session_authentication.authenticate(request)
@@ -10,6 +10,10 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from .models import User
+from .visits import record_visit
+from .auth_backends import invalidate_cached_token, get_session_key_from_token
+from .token_store import SIGNED_BACKEND, get_token_backend, issue_token, revoke_token
+from apps.core.db_router import pin_credential_to_primary
 from oauth2_provider.models import Application, AccessToken
 from oauth2_provider.settings import oauth2_settings
 from datetime import timedelta
@@ -128,28 +132,18 @@ def signup(request):
         logger.info(f"New user registered: {email}")
         
         # Track visit
-        user.update_visit_tracking()
+        record_visit(user)
         
-        # Generate simple session-based token (temporary fix for OAuth2 issues)
-        from django.contrib.sessions.models import Session
-
-        # Store user info in session (temporary approach)
-        from django.contrib.sessions.backends.db import SessionStore
-        session = SessionStore()
-        session['user_id'] = str(user.id)
-        session['user_email'] = user.email
-        session['authenticated'] = True
-        session.create()
-
-        # Use the actual session key as the token
-        token = session.session_key
+        # Issue a Bearer token through the configured token backend
+        token = issue_token(user)
+        pin_credential_to_primary(token)
 
         # Set the session cookie in the response
         response = JsonResponse({
             'access_token': token,
             'token_type': 'Bearer',
             'expires_in': 3600,  # 1 hour
-            'session_key': session.session_key,
+            'session_key': token,
             'user': {
                 'id': user.id,
                 'email': user.email,
@@ -164,14 +158,15 @@ def signup(request):
         }, status=status.HTTP_201_CREATED)
 
         # Set the session cookie so Django session auth works
-        response.set_cookie(
-            'sessionid',
-            session.session_key,
-            max_age=3600,  # 1 hour
-            httponly=True,
-            secure=False,  # Set to True in production with HTTPS
-            samesite='Lax'
-        )
+        if get_token_backend() != SIGNED_BACKEND:
+            response.set_cookie(
+                'sessionid',
+                token,
+                max_age=3600,  # 1 hour
+                httponly=True,
+                secure=False,  # Set to True in production with HTTPS
+                samesite='Lax'
+            )
 
         logger.info(f"✅ User registered with session token: {email}")
 
@@ -257,27 +252,18 @@ def login_view(request):
         logger.info(f"🎉 User login successful: {email}")
         
         # Track visit
-        user.update_visit_tracking()
+        record_visit(user)
         
-        # Generate simple session-based token (temporary fix for OAuth2 issues)
-        from django.contrib.sessions.backends.db import SessionStore
-
-        # Store user info in session (temporary approach)
-        session = SessionStore()
-        session['user_id'] = str(user.id)
-        session['user_email'] = user.email
-        session['authenticated'] = True
-        session.create()
-
-        # Use the actual session key as the token
-        token = session.session_key
+        # Issue a Bearer token through the configured token backend
+        token = issue_token(user)
+        pin_credential_to_primary(token)
 
         # Set the session cookie in the response
         response = JsonResponse({
             'access_token': token,
             'token_type': 'Bearer',
             'expires_in': 3600,  # 1 hour
-            'session_key': session.session_key,
+            'session_key': token,
             'user': {
                 'id': user.id,
                 'email': user.email,
@@ -292,14 +278,15 @@ def login_view(request):
         }, status=200)
 
         # Set the session cookie so Django session auth works
-        response.set_cookie(
-            'sessionid',
-            session.session_key,
-            max_age=3600,  # 1 hour
-            httponly=True,
-            secure=False,  # Set to True in production with HTTPS
-            samesite='Lax'
-        )
+        if get_token_backend() != SIGNED_BACKEND:
+            response.set_cookie(
+                'sessionid',
+                token,
+                max_age=3600,  # 1 hour
+                httponly=True,
+                secure=False,  # Set to True in production with HTTPS
+                samesite='Lax'
+            )
 
         logger.info(f"✅ User login successful with session token: {email}")
 
@@ -339,6 +326,8 @@ def logout_view(request):
             token = auth_header.split(' ')[1]
             # Delete the token
             AccessToken.objects.filter(token=token).delete()
+            revoke_token(get_session_key_from_token(token))
+            invalidate_cached_token(token)
             logger.info(f"User logged out: {request.user.email}")
         
         return Response({'message': 'Logged out successfully'})
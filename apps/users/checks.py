@@ -0,0 +1,23 @@
+"""
+System checks for the users app.
+"""
+from django.conf import settings
+from django.core.checks import Warning, register
+from apps.core.cache import is_shared_cache
+
+
+@register()
+def check_token_backend_cache(app_configs, **kwargs):
+    """Warn when a Bearer token backend that keeps state in the cache has a per-process cache."""
+    backend = getattr(settings, 'BEARER_TOKEN_BACKEND', 'db')
+    if backend not in ('cache', 'signed') or is_shared_cache():
+        return []
+    return [
+        Warning(
+            f"BEARER_TOKEN_BACKEND={backend!r} keeps "
+            f"{'sessions' if backend == 'cache' else 'the logout revocation set'} in the default cache, "
+            "which is not shared between processes.",
+            hint="Use the Redis cache (CACHE_BACKEND=redis) so logins and logouts reach every worker.",
+            id='users.W001',
+        )
+    ]
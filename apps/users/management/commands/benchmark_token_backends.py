@@ -0,0 +1,70 @@
+"""
+Management command to benchmark Bearer token backends.
+"""
+import time
+import uuid
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from apps.users.auth_backends import SessionTokenAuthentication
+from apps.users.models import User
+from apps.users.token_store import SESSION_BACKENDS, SIGNED_BACKEND, issue_token, revoke_token
+
+
+class Command(BaseCommand):
+    help = 'Compare login and authenticated-request throughput of each Bearer token backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=500,
+            help='Number of logins and authenticated requests per backend',
+        )
+        parser.add_argument(
+            '--backend',
+            action='append',
+            choices=list(SESSION_BACKENDS) + [SIGNED_BACKEND],
+            help='Backend to benchmark (repeatable, defaults to all)',
+        )
+        parser.add_argument(
+            '--with-auth-cache',
+            action='store_true',
+            help='Keep the authenticated-token cache enabled (measures warm requests)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        backends = options['backend'] or list(SESSION_BACKENDS) + [SIGNED_BACKEND]
+        auth_cache_timeout = 60 if options['with_auth_cache'] else 0
+
+        email = f'benchmark-{uuid.uuid4().hex[:8]}@example.com'
+        user = User.objects.create_user(username=email, email=email, password=uuid.uuid4().hex)
+        factory = RequestFactory()
+        authenticator = SessionTokenAuthentication()
+
+        self.stdout.write(f'Benchmarking {iterations} logins and requests per backend...')
+        self.stdout.write(f'{"backend":<12}{"logins/s":>12}{"requests/s":>14}')
+        try:
+            for backend in backends:
+                with override_settings(BEARER_TOKEN_BACKEND=backend, AUTH_TOKEN_CACHE_TIMEOUT=auth_cache_timeout):
+                    start = time.perf_counter()
+                    tokens = [issue_token(user) for _ in range(iterations)]
+                    login_rate = iterations / (time.perf_counter() - start)
+
+                    start = time.perf_counter()
+                    for token in tokens:
+                        request = factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+                        if authenticator.authenticate(request) is None:
+                            self.stdout.write(self.style.ERROR(f'{backend}: token failed to authenticate'))
+                            break
+                    request_rate = iterations / (time.perf_counter() - start)
+
+                    for token in tokens:
+                        revoke_token(token)
+
+                self.stdout.write(f'{backend:<12}{login_rate:>12.0f}{request_rate:>14.0f}')
+        finally:
+            user.delete()
+
+        self.stdout.write(self.style.SUCCESS('Benchmark completed'))
@@ -97,20 +97,26 @@ class User(AbstractUser):
         super().save(*args, **kwargs)
 
     def update_visit_tracking(self):
-        """Update visit tracking for the current day."""
+        """
+        Update visit tracking for the current day synchronously.
+        Request paths use apps.users.visits.record_visit instead.
+        """
         today = timezone.now().date()
         
         if self.last_visit_date != today:
-            self.last_visit_date = today
-            self.visit_days_count += 1
-            self.save(update_fields=['last_visit_date', 'visit_days_count'])
+            # Conditional F() update so concurrent requests count the day once
+            updated = User.objects.filter(pk=self.pk).filter(
+                models.Q(last_visit_date__isnull=True) | models.Q(last_visit_date__lt=today)
+            ).update(visit_days_count=models.F('visit_days_count') + 1, last_visit_date=today)
+            self.refresh_from_db(fields=['last_visit_date', 'visit_days_count'])
             
-            # Create visit record
-            Visit.objects.get_or_create(
-                user=self,
-                visited_date=today,
-                defaults={'created_at': timezone.now()}
-            )
+            if updated:
+                # Create visit record
+                Visit.objects.get_or_create(
+                    user=self,
+                    visited_date=today,
+                    defaults={'created_at': timezone.now()}
+                )
 
 
 class Visit(models.Model):
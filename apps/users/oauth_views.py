@@ -15,6 +15,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from .models import User
+from .token_store import SIGNED_BACKEND, get_token_backend, issue_token
+from apps.core.db_router import pin_credential_to_primary
+from .visits import record_visit
 import json
 import logging
 
@@ -104,7 +107,7 @@ def google_oauth_callback(request):
             logger.info(f"Updated existing user: {email}")
         
         # Track visit
-        user.update_visit_tracking()
+        record_visit(user)
         
         # Generate or get OAuth2 token for API access
         from oauth2_provider.models import Application, AccessToken
@@ -192,27 +195,18 @@ def demo_login(request):
             logger.info(f"Updated demo user: {email} with role: {user.role}")
         
         # Track visit
-        user.update_visit_tracking()
+        record_visit(user)
         
-        # Generate session-based token for consistency with main login
-        from django.contrib.sessions.backends.db import SessionStore
-
-        # Store user info in session
-        session = SessionStore()
-        session['user_id'] = str(user.id)
-        session['user_email'] = user.email
-        session['authenticated'] = True
-        session.create()
-
-        # Use the actual session key as the token
-        token = session.session_key
+        # Issue a Bearer token through the configured token backend, like the main login
+        token = issue_token(user)
+        pin_credential_to_primary(token)
 
         # Set the session cookie in the response
         response = Response({
             'access_token': token,
             'token_type': 'Bearer',
             'expires_in': 3600,  # 1 hour
-            'session_key': session.session_key,
+            'session_key': token,
             'user': {
                 'id': user.id,
                 'email': user.email,
@@ -228,14 +222,15 @@ def demo_login(request):
         }, status=status.HTTP_200_OK)
 
         # Set the session cookie so Django session auth works
-        response.set_cookie(
-            'sessionid',
-            session.session_key,
-            max_age=3600,  # 1 hour
-            httponly=True,
-            secure=False,  # Set to True in production with HTTPS
-            samesite='Lax'
-        )
+        if get_token_backend() != SIGNED_BACKEND:
+            response.set_cookie(
+                'sessionid',
+                token,
+                max_age=3600,  # 1 hour
+                httponly=True,
+                secure=False,  # Set to True in production with HTTPS
+                samesite='Lax'
+            )
 
         return response
         
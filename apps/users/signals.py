@@ -0,0 +1,19 @@
+"""
+Signal handlers for users app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import User
+from .auth_backends import invalidate_user_tokens
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, **kwargs):
+    """Drop cached tokens so deactivation and profile changes apply immediately."""
+    invalidate_user_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    """Drop cached tokens of deleted users."""
+    invalidate_user_tokens(instance.pk)
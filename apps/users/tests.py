@@ -1,13 +1,19 @@
 """
 Tests for users app.
 """
-from django.test import TestCase, Client
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.utils import timezone
+from unittest.mock import patch
 from rest_framework.test import APITestCase
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
+from .auth_backends import SessionTokenAuthentication, invalidate_cached_token
+from .token_store import issue_token, resolve_token, revoke_token
+from .models import Visit
+from .visits import flush_pending_visits, record_visit
 import json
 
 User = get_user_model()
@@ -137,10 +143,227 @@ class UserAPITest(APITestCase):
         response = self.client.post(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Written behind by the flush task when the cache is shared, directly otherwise
+        flush_pending_visits()
         self.user.refresh_from_db()
         self.assertEqual(self.user.visit_days_count, 1)
 
 
+class SessionTokenAuthenticationTest(TestCase):
+    """Test the cached Bearer session token authentication path."""
+
+    def setUp(self):
+        from django.contrib.sessions.backends.db import SessionStore
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='token@example.com',
+            email='token@example.com',
+            password='testpass123'
+        )
+        session = SessionStore()
+        session['user_id'] = str(self.user.id)
+        session['user_email'] = self.user.email
+        session.create()
+        self.token = session.session_key
+        self.factory = RequestFactory()
+        self.backend = SessionTokenAuthentication()
+
+    def _authenticate(self):
+        request = self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        return self.backend.authenticate(request)
+
+    def test_warm_request_makes_no_queries(self):
+        """Test that a cached token authenticates without touching the database."""
+        user, _ = self._authenticate()
+        self.assertEqual(user, self.user)
+
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate()
+        self.assertEqual(user, self.user)
+
+    def test_deactivation_invalidates_cache(self):
+        """Test that deactivating a user drops their cached tokens."""
+        self._authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIsNone(self._authenticate())
+
+    def test_logout_invalidates_cache(self):
+        """Test that logging out drops the cached token."""
+        self._authenticate()
+        invalidate_cached_token(self.token)
+
+        with self.assertNumQueries(2):
+            self._authenticate()
+
+
+class TokenBackendTest(TestCase):
+    """Test the pluggable Bearer token backends."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='backend@example.com',
+            email='backend@example.com',
+            password='testpass123'
+        )
+
+    def test_issue_resolve_and_revoke(self):
+        """Test that each backend round-trips and revokes tokens."""
+        for backend in ['db', 'cached_db', 'cache', 'signed']:
+            with self.subTest(backend=backend), self.settings(BEARER_TOKEN_BACKEND=backend):
+                token = issue_token(self.user)
+                token_data = resolve_token(token)
+                self.assertEqual(token_data.user_id, str(self.user.id))
+                self.assertEqual(token_data.user_email, self.user.email)
+                self.assertGreater(token_data.expire_date, timezone.now())
+
+                revoke_token(token)
+                self.assertIsNone(resolve_token(token))
+
+    def test_signed_token_rejects_tampering(self):
+        """Test that a modified signed token does not resolve."""
+        with self.settings(BEARER_TOKEN_BACKEND='signed'):
+            token = issue_token(self.user)
+            self.assertIsNone(resolve_token(token[:-2] + 'xx'))
+
+    def test_signed_login_writes_no_session(self):
+        """Test that signed-token logins authenticate without a session row."""
+        from django.contrib.sessions.models import Session
+        with self.settings(BEARER_TOKEN_BACKEND='signed'):
+            response = self.client.post(
+                reverse('users:login'),
+                data=json.dumps({'email': 'backend@example.com', 'password': 'testpass123'}),
+                content_type='application/json'
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(Session.objects.count(), 0)
+
+            token = response.json()['access_token']
+            response = self.client.get(reverse('users:current-user'), HTTP_AUTHORIZATION=f'Bearer {token}')
+            self.assertEqual(response.status_code, 200)
+
+
+    def test_demo_login_uses_token_backend(self):
+        """Test that demo tokens authenticate under every backend."""
+        for backend in ['db', 'cached_db', 'cache', 'signed']:
+            with self.subTest(backend=backend), self.settings(BEARER_TOKEN_BACKEND=backend):
+                response = Client().post(
+                    reverse('users:demo-login'),
+                    data=json.dumps({'email': 'demo@example.com'}),
+                    content_type='application/json'
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual('sessionid' in response.cookies, backend != 'signed')
+
+                token = response.json()['access_token']
+                response = Client().get(reverse('users:current-user'), HTTP_AUTHORIZATION=f'Bearer {token}')
+                self.assertEqual(response.status_code, 200)
+
+    def test_cache_state_backends_warn_without_shared_cache(self):
+        """Test the system check for cache-backed token state."""
+        from .checks import check_token_backend_cache
+        with self.settings(BEARER_TOKEN_BACKEND='signed'):
+            self.assertEqual([w.id for w in check_token_backend_cache(None)], ['users.W001'])
+        with self.settings(BEARER_TOKEN_BACKEND='db'):
+            self.assertEqual(check_token_backend_cache(None), [])
+
+
+@override_settings(VISIT_TRACKING_WRITE_BEHIND=True)
+class WriteBehindVisitTest(TestCase):
+    """Test cache-queued visit tracking and its batch flush."""
+
+    def setUp(self):
+        cache.clear()
+        # The test cache is per-process; treat it as shared like Redis
+        patcher = patch('apps.users.visits.is_shared_cache', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.users = [
+            User.objects.create_user(username=f'visit{i}@example.com', email=f'visit{i}@example.com', password='x')
+            for i in range(3)
+        ]
+
+    def test_repeat_visits_make_no_queries(self):
+        user = self.users[0]
+        with self.assertNumQueries(0):
+            self.assertTrue(record_visit(user))
+            # Another worker's stale copy of the user is stopped by the cache marker
+            self.assertFalse(record_visit(User(pk=user.pk)))
+            self.assertFalse(record_visit(user))
+        self.assertFalse(Visit.objects.exists())
+
+    def test_flush_writes_visits_in_batches(self):
+        for user in self.users:
+            record_visit(user)
+            record_visit(user)
+
+        with self.assertNumQueries(4):
+            # savepoint, visits insert, one users update, release
+            summary = flush_pending_visits(batch_size=10)
+        self.assertEqual(summary, {'events': 3, 'users_updated': 3})
+        self.assertEqual(Visit.objects.count(), 3)
+        for user in self.users:
+            user.refresh_from_db()
+            self.assertEqual(user.visit_days_count, 1)
+
+        self.assertEqual(flush_pending_visits()['events'], 0)
+
+    def test_flush_is_idempotent_across_days(self):
+        user = self.users[0]
+        today = timezone.now().date()
+        record_visit(user, today=today - timezone.timedelta(days=1))
+        record_visit(user, today=today)
+        flush_pending_visits(batch_size=1)
+
+        # A replayed event for an already counted day changes nothing
+        cache.delete(f"visits:seen:{today.isoformat()}:{user.pk}")
+        record_visit(User.objects.get(pk=user.pk), today=today)
+        flush_pending_visits()
+
+        user.refresh_from_db()
+        self.assertEqual(user.visit_days_count, 2)
+        self.assertEqual(user.last_visit_date, today)
+        self.assertEqual(Visit.objects.filter(user=user).count(), 2)
+
+    def test_flush_stops_at_unwritten_event(self):
+        first, second = self.users[:2]
+        record_visit(first)
+        # A visit that has taken its sequence number but not stored its event yet
+        cache.incr('visits:seq')
+        record_visit(second)
+
+        self.assertEqual(flush_pending_visits()['events'], 1)
+        cache.set('visits:event:2', (str(self.users[2].pk), timezone.now().date().isoformat()))
+        self.assertEqual(flush_pending_visits()['events'], 2)
+        self.assertEqual(Visit.objects.count(), 3)
+
+    def test_evicted_event_skipped_on_next_flush(self):
+        record_visit(self.users[0])
+        cache.incr('visits:seq')
+        record_visit(self.users[1])
+
+        self.assertEqual(flush_pending_visits()['events'], 1)
+        self.assertEqual(flush_pending_visits()['events'], 1)
+        self.assertEqual(Visit.objects.count(), 2)
+
+    def test_write_behind_off_writes_synchronously(self):
+        user = self.users[0]
+        with self.settings(VISIT_TRACKING_WRITE_BEHIND=False):
+            self.assertTrue(record_visit(user))
+        self.assertTrue(Visit.objects.filter(user=user).exists())
+        self.assertEqual(flush_pending_visits()['events'], 0)
+
+    def test_per_process_cache_writes_synchronously(self):
+        user = self.users[0]
+        with patch('apps.users.visits.is_shared_cache', return_value=False):
+            self.assertTrue(record_visit(user))
+        user.refresh_from_db()
+        self.assertEqual(user.visit_days_count, 1)
+        self.assertEqual(flush_pending_visits()['events'], 0)
+
+
 class UserAuthenticationTest(APITestCase):
     """Test user authentication."""
     
@@ -0,0 +1,124 @@
+"""
+Bearer token storage for email/password logins.
+
+The backend is chosen with the BEARER_TOKEN_BACKEND setting:
+
+- ``db``: a row in django_session per token (the original behaviour).
+- ``cached_db``: django_session rows fronted by the cache; reads rarely hit the database.
+- ``cache``: sessions kept only in the cache; requires a shared cache such as Redis.
+- ``signed``: stateless signed tokens embedding user id, email and expiry.
+  Logged-out tokens are kept in a server-side revocation set in the cache
+  until they would have expired.
+
+``cache`` and ``signed`` need the shared Redis cache: with a per-process
+cache a token (or its revocation on logout) only exists on the worker that
+handled the request. The users.W001 system check warns about that setup.
+"""
+import secrets
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from importlib import import_module
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.utils import timezone
+
+SESSION_BACKENDS = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+}
+SIGNED_BACKEND = 'signed'
+SIGNED_TOKEN_SALT = 'apps.users.bearer-token'
+
+
+@dataclass
+class TokenData:
+    """User identity carried by a Bearer token."""
+    user_id: str
+    user_email: str
+    expire_date: datetime
+
+
+def get_token_backend():
+    """Get the configured Bearer token backend name."""
+    backend = getattr(settings, 'BEARER_TOKEN_BACKEND', 'db')
+    if backend != SIGNED_BACKEND and backend not in SESSION_BACKENDS:
+        raise ValueError(f"Unknown BEARER_TOKEN_BACKEND: {backend}")
+    return backend
+
+
+def get_token_max_age():
+    """Get the Bearer token lifetime in seconds."""
+    return getattr(settings, 'BEARER_TOKEN_MAX_AGE', settings.SESSION_COOKIE_AGE)
+
+
+def get_session_store_class(backend=None):
+    """Get the SessionStore class for a session-based backend."""
+    backend = backend or get_token_backend()
+    return import_module(SESSION_BACKENDS[backend]).SessionStore
+
+
+def issue_token(user):
+    """Issue a Bearer token for a user and return it."""
+    backend = get_token_backend()
+    expire_date = timezone.now() + timedelta(seconds=get_token_max_age())
+
+    if backend == SIGNED_BACKEND:
+        return signing.dumps({
+            'uid': str(user.id),
+            'email': user.email,
+            'exp': int(expire_date.timestamp()),
+            'jti': secrets.token_hex(8),
+        }, salt=SIGNED_TOKEN_SALT, compress=True)
+
+    session = get_session_store_class(backend)()
+    session['user_id'] = str(user.id)
+    session['user_email'] = user.email
+    session['authenticated'] = True
+    session.set_expiry(expire_date)
+    session.create()
+    return session.session_key
+
+
+def resolve_token(token):
+    """Resolve a Bearer token to its TokenData, or None if invalid, expired or revoked."""
+    backend = get_token_backend()
+
+    if backend == SIGNED_BACKEND:
+        try:
+            payload = signing.loads(token, salt=SIGNED_TOKEN_SALT, max_age=get_token_max_age())
+        except signing.BadSignature:
+            return None
+        expire_date = datetime.fromtimestamp(payload['exp'], tz=dt_timezone.utc)
+        if expire_date <= timezone.now() or cache.get(_revoked_key(payload['jti'])):
+            return None
+        return TokenData(payload['uid'], payload['email'], expire_date)
+
+    session = get_session_store_class(backend)(session_key=token)
+    data = session.load()
+    if not data.get('user_id') or not data.get('user_email'):
+        return None
+    expire_date = session.get_expiry_date(expiry=data.get('_session_expiry'))
+    return TokenData(data['user_id'], data['user_email'], expire_date)
+
+
+def revoke_token(token):
+    """Revoke a Bearer token so it can no longer authenticate."""
+    backend = get_token_backend()
+
+    if backend == SIGNED_BACKEND:
+        try:
+            payload = signing.loads(token, salt=SIGNED_TOKEN_SALT, max_age=get_token_max_age())
+        except signing.BadSignature:
+            return
+        remaining = payload['exp'] - int(timezone.now().timestamp())
+        if remaining > 0:
+            cache.set(_revoked_key(payload['jti']), True, remaining)
+        return
+
+    get_session_store_class(backend)(session_key=token).delete()
+
+
+def _revoked_key(jti):
+    return f"auth:revoked:{jti}"
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from django.contrib.auth import get_user_model
 from .serializers import UserSerializer, UserUpdateSerializer
 from .models import User
+from .visits import record_visit
 
 User = get_user_model()
 
@@ -41,5 +42,5 @@ def track_visit(request):
     """
     Track user visit for the current day.
     """
-    request.user.update_visit_tracking()
+    record_visit(request.user)
     return Response({'message': 'Visit tracked successfully'})
@@ -0,0 +1,156 @@
+"""
+Write-behind visit tracking.
+
+A visit is recorded in the cache: a per-(user, date) marker makes repeat
+visits on the same day free, and the first visit of the day is queued as
+an event. The flush_visit_tracking Celery task drains the queue in batches,
+inserting Visit rows and bumping users.visit_days_count with conditional
+F() updates, so the request path makes no database writes.
+
+Write-behind is opt-in through VISIT_TRACKING_WRITE_BEHIND, since queued
+visits are only written where Celery beat schedules the flush. Queued
+visits also only reach the flush task through a cache shared between web
+and Celery workers, so visits are written synchronously instead while the
+cache is per-process (LocMem, or Redis down and its fallback serving).
+
+A visit takes its sequence number before its event is stored, so a flush
+stops at the first missing event instead of moving past it; an event still
+missing on the next flush was evicted and is skipped.
+"""
+import logging
+from collections import defaultdict
+from datetime import date
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from apps.core.cache import is_shared_cache
+from .models import User, Visit
+
+logger = logging.getLogger(__name__)
+
+VISIT_SEEN_KEY_PREFIX = 'visits:seen'
+VISIT_EVENT_KEY_PREFIX = 'visits:event'
+VISIT_SEQUENCE_KEY = 'visits:seq'
+VISIT_FLUSHED_KEY = 'visits:flushed'
+VISIT_GAP_KEY = 'visits:gap'
+# Queued events and markers outlive a missed flush or two
+VISIT_KEY_TIMEOUT = 60 * 60 * 48
+
+
+def _write_behind_enabled():
+    return getattr(settings, 'VISIT_TRACKING_WRITE_BEHIND', False) and is_shared_cache()
+
+
+def _next_sequence():
+    cache.add(VISIT_SEQUENCE_KEY, 0, None)
+    try:
+        return cache.incr(VISIT_SEQUENCE_KEY)
+    except ValueError:
+        # Evicted between add and incr
+        cache.add(VISIT_SEQUENCE_KEY, 0, None)
+        return cache.incr(VISIT_SEQUENCE_KEY)
+
+
+def record_visit(user, today=None):
+    """
+    Record that a user visited today.
+    Returns True when this is the first visit queued for the day.
+    """
+    if not _write_behind_enabled():
+        user.update_visit_tracking()
+        return True
+
+    today = today or timezone.now().date()
+    if user.last_visit_date == today:
+        return False
+    if not cache.add(f"{VISIT_SEEN_KEY_PREFIX}:{today.isoformat()}:{user.pk}", True, VISIT_KEY_TIMEOUT):
+        return False
+
+    sequence = _next_sequence()
+    cache.set(f"{VISIT_EVENT_KEY_PREFIX}:{sequence}", (str(user.pk), today.isoformat()), VISIT_KEY_TIMEOUT)
+
+    # Reflect the visit in this response; the flush is a no-op if this instance is saved first
+    user.last_visit_date = today
+    user.visit_days_count += 1
+    return True
+
+
+def apply_visits(visits):
+    """
+    Write (user_id, date) visits to the database.
+    Idempotent: a user's count only moves when the visit is newer than their
+    last recorded visit, and Visit rows are deduplicated by their unique key.
+    """
+    users_by_date = defaultdict(set)
+    for user_id, visited_date in visits:
+        users_by_date[visited_date].add(user_id)
+
+    counted = 0
+    with transaction.atomic():
+        Visit.objects.bulk_create(
+            [
+                Visit(user_id=user_id, visited_date=visited_date)
+                for visited_date, user_ids in users_by_date.items()
+                for user_id in user_ids
+            ],
+            ignore_conflicts=True,
+        )
+        # Oldest first so a user with visits on two days ends on the latest
+        for visited_date in sorted(users_by_date):
+            counted += User.objects.filter(pk__in=users_by_date[visited_date]).filter(
+                Q(last_visit_date__isnull=True) | Q(last_visit_date__lt=visited_date)
+            ).update(
+                visit_days_count=F('visit_days_count') + 1,
+                last_visit_date=visited_date,
+            )
+    return counted
+
+
+def flush_pending_visits(batch_size=None):
+    """
+    Drain queued visit events into the database in batches.
+    Returns counts of events read and user rows updated.
+    """
+    batch_size = batch_size or getattr(settings, 'VISIT_FLUSH_BATCH_SIZE', 1000)
+    end = cache.get(VISIT_SEQUENCE_KEY) or 0
+    start = cache.get(VISIT_FLUSHED_KEY) or 0
+    if end < start:
+        # The sequence was evicted and restarted
+        start = 0
+    gap = cache.get(VISIT_GAP_KEY)
+
+    events = 0
+    counted = 0
+    flushed = start
+    for batch_start in range(start + 1, end + 1, batch_size):
+        batch_end = min(batch_start + batch_size, end + 1)
+        keys = {n: f"{VISIT_EVENT_KEY_PREFIX}:{n}" for n in range(batch_start, batch_end)}
+        found = cache.get_many(list(keys.values()))
+        visits = []
+        for n, key in keys.items():
+            event = found.get(key)
+            if event is None and n != gap:
+                # Numbered but not stored yet: resume here next time
+                cache.set(VISIT_GAP_KEY, n, VISIT_KEY_TIMEOUT)
+                break
+            if event is not None:
+                user_id, visited_date = event
+                visits.append((user_id, date.fromisoformat(visited_date)))
+            flushed = n
+
+        if visits:
+            counted += apply_visits(visits)
+            events += len(visits)
+        cache.delete_many([keys[n] for n in range(batch_start, flushed + 1)])
+        cache.set(VISIT_FLUSHED_KEY, flushed, None)
+        if flushed < batch_end - 1:
+            break
+
+    if events:
+        logger.info(f"Flushed {events} visit events, updated {counted} users")
+    return {
+        'events': events,
+        'users_updated': counted,
+    }
@@ -1,10 +1,12 @@
 import React, { useState, useEffect } from 'react';
-import { apiService } from '../../services/api';
-import { Content } from '../../types';
+import { apiService, getNextCursor } from '../../services/api';
+import { Content, CursorPage } from '../../types';
 import { Dialog, DialogBackdrop, DialogTitle } from '@headlessui/react';
 
 const PendingApprovals: React.FC = () => {
   const [pendingContent, setPendingContent] = useState<Content[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selectedContent, setSelectedContent] = useState<Content | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -15,11 +17,14 @@ const PendingApprovals: React.FC = () => {
     loadPendingContent();
   }, []);
 
+  // The queue is listed as summaries a page at a time; the full story is fetched on selection
   const loadPendingContent = async () => {
     try {
-      const response = await apiService.getPendingSubmissions();
-      console.log('Pending submissions loaded:', response.data);
-      setPendingContent(response.data);
+      const response = await apiService.getPendingSubmissions({ pagination: 'cursor', view: 'summary' });
+      const page: CursorPage<Content> = response.data;
+      console.log('Pending submissions loaded:', page);
+      setPendingContent(page.results);
+      setNextCursor(getNextCursor(page.next));
     } catch (err) {
       setError('Failed to load pending submissions');
       console.error(err);
@@ -28,6 +33,33 @@ const PendingApprovals: React.FC = () => {
     }
   };
 
+  const loadMorePendingContent = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await apiService.getPendingSubmissions({ cursor: nextCursor, view: 'summary' });
+      const page: CursorPage<Content> = response.data;
+      setPendingContent((loaded) => [...loaded, ...page.results]);
+      setNextCursor(getNextCursor(page.next));
+    } catch (err) {
+      setError('Failed to load pending submissions');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const selectContent = async (contentId: string) => {
+    try {
+      const response = await apiService.getSubmissionContent(contentId);
+      console.log('Selected content:', response.data);
+      setSelectedContent(response.data);
+    } catch (err) {
+      setError('Failed to load submission');
+      console.error(err);
+    }
+  };
+
   const handleApprove = async (contentId: string) => {
     try {
       await apiService.approveSubmission(contentId);
@@ -91,7 +123,9 @@ const PendingApprovals: React.FC = () => {
     <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
       {/* Left Panel - List of Pending Stories */}
       <div className="bg-white rounded-lg shadow-sm p-4">
-        <h2 className="text-lg font-semibold mb-4">Pending Stories ({pendingContent.length})</h2>
+        <h2 className="text-lg font-semibold mb-4">
+          Pending Stories ({pendingContent.length}{nextCursor ? '+' : ''})
+        </h2>
         <div className="space-y-3">
           {pendingContent.map((content) => (
             <div
@@ -103,10 +137,7 @@ const PendingApprovals: React.FC = () => {
                   : 'bg-gray-50 border-gray-200 hover:bg-gray-100 hover:border-gray-300 hover:shadow-sm'
                 }
               `}
-              onClick={() => {
-                console.log('Selected content:', content);
-                setSelectedContent(content);
-              }}
+              onClick={() => selectContent(content.id)}
             >
               <div className="flex justify-between items-start mb-2">
                 <h3 className="font-medium text-gray-900 flex-1">
@@ -131,14 +162,21 @@ const PendingApprovals: React.FC = () => {
                    lineHeight: '1.4em',
                    maxHeight: '2.8em'
                  }}>
-                {content.rich_content
-                  ? content.rich_content.replace(/<[^>]*>/g, '').substring(0, 150) + '...'
-                  : content.body.substring(0, 150) + '...'
-                }
+                {(content.excerpt || '').replace(/<[^>]*>/g, '').substring(0, 150) + '...'}
               </p>
             </div>
           ))}
           
+          {nextCursor && (
+            <button
+              onClick={loadMorePendingContent}
+              disabled={loadingMore}
+              className="w-full py-2 text-sm font-medium text-primary-600 bg-white border border-gray-200 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          )}
+
           {pendingContent.length === 0 && (
             <p className="text-gray-500 text-center py-8">
               No pending stories to review! 🎉
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
-import { User, Content } from '../../types';
-import { apiService } from '../../services/api';
+import { User, Content, CursorPage } from '../../types';
+import { apiService, getNextCursor } from '../../services/api';
 import TiptapEditor from '../Editor/TiptapEditor';
 
 interface UserStorySubmissionProps {
@@ -20,27 +20,44 @@ const UserStorySubmission: React.FC<UserStorySubmissionProps> = ({ user, showMyS
   const [error, setError] = useState<string | null>(null);
   const [success, setSuccess] = useState<string | null>(null);
   const [mySubmissions, setMySubmissions] = useState<Content[]>([]);
+  const [submissionCounts, setSubmissionCounts] = useState<Record<string, number> | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [editingSubmission, setEditingSubmission] = useState<Content | null>(null);
 
   useEffect(() => {
     if (showMySubmissions) {
       loadMySubmissions();
     }
-  }, [showMySubmissions]);
+  }, [showMySubmissions, statusFilter]);
 
   const handleContentChange = (newContent: string) => {
     setContent(newContent);
   };
 
-  const loadMySubmissions = async () => {
+  // Submissions are filtered by status on the server and loaded a page at a time
+  const loadMySubmissions = async (cursor?: string) => {
     try {
-      const response = await apiService.getMySubmissions();
-      setMySubmissions(response.data);
+      const params = cursor
+        ? { cursor, status: statusFilter }
+        : { pagination: 'cursor', status: statusFilter };
+      const response = await apiService.getMySubmissions(params);
+      const page: CursorPage<Content> = response.data;
+      setMySubmissions((loaded) => (cursor ? [...loaded, ...page.results] : page.results));
+      setSubmissionCounts(page.counts || null);
+      setNextCursor(getNextCursor(page.next));
     } catch (err) {
       console.error('Failed to load submissions:', err);
     }
   };
 
+  const loadMoreSubmissions = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await loadMySubmissions(nextCursor);
+    setLoadingMore(false);
+  };
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     setLoading(true);
@@ -147,6 +164,7 @@ const UserStorySubmission: React.FC<UserStorySubmissionProps> = ({ user, showMyS
         <div className="bg-white rounded-lg shadow-sm p-6">
           <h2 className="text-xl font-semibold mb-4">
             📝 My Submissions
+            {submissionCounts && ` (${submissionCounts[statusFilter || 'total']})`}
           </h2>
 
           <div className="space-y-4">
@@ -230,6 +248,16 @@ const UserStorySubmission: React.FC<UserStorySubmissionProps> = ({ user, showMyS
               </div>
             ))}
 
+            {nextCursor && (
+              <button
+                onClick={loadMoreSubmissions}
+                disabled={loadingMore}
+                className="w-full py-2 text-sm font-medium text-primary-600 bg-white border border-gray-200 rounded-lg hover:bg-gray-50 disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            )}
+
             {mySubmissions.filter(submission => !statusFilter || submission.approval_status === statusFilter).length === 0 && (
               <p className="text-center text-gray-500 py-8">
                 {statusFilter ? `No ${statusFilter} submissions found.` : "You haven't submitted any stories yet."}
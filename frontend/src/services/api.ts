@@ -40,6 +40,10 @@ api.interceptors.response.use(
   }
 );
 
+// Read the cursor for the next page out of a keyset page's `next` link
+export const getNextCursor = (next: string | null): string | null =>
+  next ? new URL(next, window.location.origin).searchParams.get('cursor') : null;
+
 // API endpoints
 export const apiService = {
   // Auth
@@ -79,11 +83,12 @@ export const apiService = {
   
   // User Story Submission
   submitStory: (data: any) => api.post('/content/submit-story/', data),
-  getMySubmissions: () => api.get('/content/my-submissions/'),
+  getMySubmissions: (params?: any) => api.get('/content/my-submissions/', { params }),
   deleteSubmission: (id: string) => api.delete(`/content/submissions/${id}/delete/`),
   
   // Admin Approval
-  getPendingSubmissions: () => api.get('/content/admin/pending/'),
+  getPendingSubmissions: (params?: any) => api.get('/content/admin/pending/', { params }),
+  getSubmissionContent: (id: string) => api.get(`/content/admin/${id}/submission/`),
   approveSubmission: (id: string) => api.post(`/content/admin/${id}/approve/`),
   rejectSubmission: (id: string, rejectionReason: string) =>
     api.post(`/content/admin/${id}/reject/`, { rejection_reason: rejectionReason }),
@@ -17,6 +17,7 @@ export interface Content {
   content_type: 'MOTIVATION' | 'JOKES' | 'QUOTATION' | 'PUZZLE';
   title?: string;
   body: string;
+  excerpt?: string;
   rich_content?: string;
   youtube_url?: string;
   news_url?: string;
@@ -51,6 +52,12 @@ export interface ApiResponse<T> {
   status: string;
 }
 
+export interface CursorPage<T> {
+  next: string | null;
+  results: T[];
+  counts?: Record<string, number>;
+}
+
 export interface PaginatedResponse<T> {
   results: T[];
   count: number;
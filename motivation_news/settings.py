@@ -3,8 +3,10 @@ Django settings for motivation_news project.
 """
 
 import os
+import sys
 from pathlib import Path
-from decouple import config
+from urllib.parse import urlsplit
+from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -58,6 +60,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.core.middleware.ReplicaRoutingMiddleware',
     'oauth2_provider.middleware.OAuth2TokenMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -98,6 +101,35 @@ DATABASES = {
     }
 }
 
+# Persistent connections: seconds to keep a connection open (0 closes per request, None never closes)
+DATABASES["default"]["CONN_MAX_AGE"] = config('DB_CONN_MAX_AGE', default=60, cast=int)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+
+# Read replicas: comma-separated SQLite paths standing in for replicas locally
+DATABASE_REPLICAS = []
+for index, replica_path in enumerate(config('DATABASE_REPLICA_PATHS', default='', cast=Csv())):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": replica_path,
+        "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": DATABASES["default"]["CONN_HEALTH_CHECKS"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['apps.core.db_router.PrimaryReplicaRouter']
+REPLICA_READ_APPS = ('content', 'users')
+# How long a client reads from the primary after its own write
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=10, cast=int)
+
+# SQLite pragmas applied to every new connection (apps.core.db); empty values are skipped
+SQLITE_JOURNAL_MODE = config('SQLITE_JOURNAL_MODE', default='WAL')
+SQLITE_SYNCHRONOUS = config('SQLITE_SYNCHRONOUS', default='NORMAL')
+SQLITE_BUSY_TIMEOUT = config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int)  # milliseconds
+SQLITE_MMAP_SIZE = config('SQLITE_MMAP_SIZE', default=128 * 1024 * 1024, cast=int)  # bytes
+SQLITE_CACHE_SIZE = config('SQLITE_CACHE_SIZE', default=-20000, cast=int)  # negative means KiB
+
 # Ensure database directory exists and create file if needed (for production containers)
 try:
     db_dir = os.path.dirname(DATABASE_PATH)
@@ -114,6 +146,14 @@ except (OSError, PermissionError):
 # --------------------------------------------------------
 AUTH_USER_MODEL = 'users.User'
 
+# Bearer token storage for email/password logins: db, cached_db, cache or signed
+# (cache and signed keep state in the cache and need CACHE_BACKEND=redis)
+BEARER_TOKEN_BACKEND = config('BEARER_TOKEN_BACKEND', default='db')
+BEARER_TOKEN_MAX_AGE = config('BEARER_TOKEN_MAX_AGE', default=60 * 60 * 24 * 14, cast=int)
+
+# How long an authenticated Bearer token is cached (seconds, capped at session expiry)
+AUTH_TOKEN_CACHE_TIMEOUT = config('AUTH_TOKEN_CACHE_TIMEOUT', default=60, cast=int)
+
 # --------------------------------------------------------
 # Password validation
 # --------------------------------------------------------
@@ -194,6 +234,16 @@ GOOGLE_OAUTH2_CLIENT_SECRET = config('GOOGLE_CLIENT_SECRET', default='')
 # OpenAI API
 # --------------------------------------------------------
 OPENAI_API_KEY = config('OPENAI_API_KEY', default='')
+OPENAI_BASE_URL = config('OPENAI_BASE_URL', default='')
+OPENAI_TIMEOUT = config('OPENAI_TIMEOUT', default=30.0, cast=float)
+OPENAI_CONNECT_TIMEOUT = config('OPENAI_CONNECT_TIMEOUT', default=5.0, cast=float)
+OPENAI_MAX_CONNECTIONS = config('OPENAI_MAX_CONNECTIONS', default=20, cast=int)
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = config('OPENAI_MAX_KEEPALIVE_CONNECTIONS', default=10, cast=int)
+OPENAI_MAX_RETRIES = config('OPENAI_MAX_RETRIES', default=3, cast=int)
+OPENAI_RETRY_BASE_DELAY = config('OPENAI_RETRY_BASE_DELAY', default=1.0, cast=float)
+
+# Concurrent OpenAI requests during the daily all-grades generation run
+CONTENT_GENERATION_CONCURRENCY = config('CONTENT_GENERATION_CONCURRENCY', default=13, cast=int)
 
 # --------------------------------------------------------
 # Admin Settings
@@ -203,12 +253,83 @@ ADMIN_EMAILS = config('ADMIN_EMAILS', default='', cast=lambda v: [s.strip() for
 # --------------------------------------------------------
 # Celery / Redis
 # --------------------------------------------------------
-CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
-CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default='redis://localhost:6379/0')
+REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL)
+CELERY_RESULT_BACKEND = config('CELERY_RESULT_BACKEND', default=REDIS_URL)
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'purge-expired-auth-data': {
+        'task': 'apps.core.tasks.purge_expired_auth_data',
+        'schedule': config('AUTH_CLEANUP_INTERVAL', default=3600, cast=int),
+    },
+    'flush-visit-tracking': {
+        'task': 'apps.core.tasks.flush_visit_tracking',
+        'schedule': config('VISIT_FLUSH_INTERVAL', default=60, cast=int),
+    },
+}
+
+# Rows deleted per transaction by the expired session/token cleanup
+AUTH_CLEANUP_CHUNK_SIZE = config('AUTH_CLEANUP_CHUNK_SIZE', default=1000, cast=int)
+
+# Opt-in: queue visits in the cache for flush-visit-tracking. Only enable where a
+# Celery worker and beat run against the shared cache; queued visits are never
+# written otherwise. Off, each first visit of the day is written synchronously.
+VISIT_TRACKING_WRITE_BEHIND = config('VISIT_TRACKING_WRITE_BEHIND', default=False, cast=bool)
+VISIT_FLUSH_BATCH_SIZE = config('VISIT_FLUSH_BATCH_SIZE', default=1000, cast=int)
+
+# --------------------------------------------------------
+# Cache
+# --------------------------------------------------------
+def redis_url_with_db(url, db):
+    """Point a redis:// URL at another database number on the same server."""
+    return urlsplit(url)._replace(path=f'/{db}').geturl()
+
+
+# Shared cache on its own database of the Celery Redis, so web and Celery
+# workers see the same keys. CACHE_BACKEND=locmem opts out to a per-process
+# cache (single-process development only; the test runner uses it too).
+TESTING = sys.argv[1:2] == ['test']
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem' if TESTING else 'redis')
+CACHE_REDIS_DB = config('CACHE_REDIS_DB', default=1, cast=int)
+CACHE_REDIS_URL = config('CACHE_REDIS_URL', default=redis_url_with_db(REDIS_URL, CACHE_REDIS_DB))
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'apps.core.cache_backends.FallbackRedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'motivino',
+            'VERSION': config('CACHE_VERSION', default=1, cast=int),
+            'TIMEOUT': 300,
+            'OPTIONS': {
+                'socket_connect_timeout': 1,
+                'socket_timeout': 1,
+                'FALLBACK_RETRY_INTERVAL': config('CACHE_FALLBACK_RETRY_INTERVAL', default=30, cast=int),
+            },
+        }
+    }
+elif CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+else:
+    raise ValueError(f"CACHE_BACKEND must be 'redis' or 'locmem', not {CACHE_BACKEND!r}")
+
+# Stampede protection in apps.core.cache.get_or_set
+CACHE_EARLY_REFRESH_BETA = config('CACHE_EARLY_REFRESH_BETA', default=1.0, cast=float)
+CACHE_LOCK_TIMEOUT = config('CACHE_LOCK_TIMEOUT', default=10, cast=int)
+
+# --------------------------------------------------------
+# Content feeds
+# --------------------------------------------------------
+FEED_CACHE_TIMEOUT = config('FEED_CACHE_TIMEOUT', default=300, cast=int)
+FEED_CACHE_MAX_ITEMS = config('FEED_CACHE_MAX_ITEMS', default=500, cast=int)
+# Admin listings reuse a cached total instead of running COUNT(*) per page
+CONTENT_COUNT_CACHE_TIMEOUT = config('CONTENT_COUNT_CACHE_TIMEOUT', default=60, cast=int)
 
 # --------------------------------------------------------
 # Scheduler
@@ -24,6 +24,8 @@ DATABASES = {
         'OPTIONS': {
             'connect_timeout': 10,
         },
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True').lower() in ('1', 'true', 'yes'),
     }
 }
 
@@ -34,6 +36,10 @@ REDIS_URL = os.environ.get('REDIS_URL', 'redis://10.0.0.1:6379/0')
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 
+# Shared cache on its own database of the same Redis unless a dedicated one is configured
+if CACHE_BACKEND == 'redis':
+    CACHES['default']['LOCATION'] = os.environ.get('CACHE_REDIS_URL', redis_url_with_db(REDIS_URL, CACHE_REDIS_DB))
+
 # Static files
 STATIC_URL = '/static/'
 STATIC_ROOT = '/app/staticfiles'
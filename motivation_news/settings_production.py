@@ -24,9 +24,30 @@ DATABASES = {
         'OPTIONS': {
             'connect_timeout': 10,
         },
+        # Reuse connections across requests; health checks drop ones the server closed
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True').lower() in ('1', 'true', 'yes'),
     }
 }
 
+# PgBouncer in transaction pooling mode: server-side cursors do not survive
+# between transactions, and pgbouncer owns pooling so Django connections stay short
+DATABASE_PGBOUNCER = os.environ.get('DATABASE_PGBOUNCER', 'False').lower() in ('1', 'true', 'yes')
+if DATABASE_PGBOUNCER:
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', '0'))
+
+# Read replicas: comma-separated hosts sharing the primary's credentials
+DATABASE_REPLICAS = []
+for index, replica_host in enumerate(filter(None, os.environ.get('DATABASE_REPLICA_HOSTS', '').split(','))):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': replica_host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
 # Redis for Celery
 REDIS_URL = os.environ.get('REDIS_URL', 'redis://redis:6379/0')
 
@@ -34,6 +55,10 @@ REDIS_URL = os.environ.get('REDIS_URL', 'redis://redis:6379/0')
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 
+# Shared cache on its own database of the same Redis unless a dedicated one is configured
+if CACHE_BACKEND == 'redis':
+    CACHES['default']['LOCATION'] = os.environ.get('CACHE_REDIS_URL', redis_url_with_db(REDIS_URL, CACHE_REDIS_DB))
+
 # Static files
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
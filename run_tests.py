@@ -11,6 +11,8 @@ from django.test.utils import get_runner
 def setup_django():
     """Setup Django environment."""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'motivation_news.settings')
+    # Tests run against the per-process cache, not a shared Redis
+    os.environ.setdefault('CACHE_BACKEND', 'locmem')
     django.setup()
 
 def run_tests():
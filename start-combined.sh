@@ -9,7 +9,7 @@ echo "🚀 Starting combined application server..."
 # Function to handle shutdown gracefully
 cleanup() {
     echo "🛑 Shutting down services..."
-    kill $GUNICORN_PID $NGINX_PID 2>/dev/null || true
+    kill $GUNICORN_PID $CELERY_PID $NGINX_PID 2>/dev/null || true
     exit 0
 }
 
@@ -49,6 +49,11 @@ fi
 
 echo "✅ Gunicorn started successfully"
 
+# Start the Celery worker with beat for the periodic tasks (auth data purge, visit flush)
+echo "⏰ Starting Celery worker and beat..."
+su - django -c "cd /app && celery -A motivation_news worker --beat --concurrency=1 --schedule=/tmp/celerybeat-schedule --loglevel=info --logfile=/app/logs/celery.log" &
+CELERY_PID=$!
+
 # Start Nginx in foreground (this will be the main process)
 echo "🌐 Starting Nginx (reverse proxy)..."
 nginx -g 'daemon off;' &